@@ -120,6 +120,7 @@ def analyze_repositories(
     analyzer: AnalyzerPort,  # type: ignore[valid-type]
     single_repo: str | None = None,
     filters: Mapping | None = None,  # type: ignore[type-arg]
+    batched: bool = False,
 ) -> Sequence[RepoAnalysis]:  # type: ignore[type-arg]
     """Analyze repositories for the given owner.
 
@@ -129,6 +130,9 @@ def analyze_repositories(
         analyzer: Port for analyzing repositories
         single_repo: Optional single repository to analyze
         filters: Optional filters to apply
+        batched: Hand every repository to ``analyzer.analyze_many`` in one
+            call; *analyzer* must then be a ``BatchAnalyzerPort``.  README and
+            commit data are still fetched one repository at a time first.
 
     Returns:
         List of repository analyses
@@ -149,7 +153,7 @@ def analyze_repositories(
             if all(getattr(repo, key, None) == value for key, value in filters.items())
         ]
 
-    analyses = []
+    repo_datas = []
     for repo in repos:
         readme_content = _get_repo_readme(owner, repo.name, source_control)
         commits_count, activity_summary = _get_repo_activity(
@@ -159,21 +163,22 @@ def analyze_repositories(
         )
 
         # Create a data dictionary for the analyzer
-        repo_data = {
-            "repo_name": repo.name,
-            "repo_desc": getattr(repo, "description", ""),
-            "repo_url": getattr(repo, "url", ""),
-            "updated_at": getattr(repo, "updated_at", ""),
-            "readme_excerpt": readme_content or "",
-            "stars": getattr(repo, "stars", 0),
-            "forks": getattr(repo, "forks", 0),
-            "is_archived": getattr(repo, "is_archived", False),
-            "recent_commits": commits_count,
-            "activity_summary": activity_summary,
-        }
-        
-        # Call the analyze method which follows the protocol
-        analysis = analyzer.analyze(repo_data)
-        analyses.append(analysis)
-
-    return analyses
+        repo_datas.append(
+            {
+                "repo_name": repo.name,
+                "repo_desc": getattr(repo, "description", ""),
+                "repo_url": getattr(repo, "url", ""),
+                "updated_at": getattr(repo, "updated_at", ""),
+                "readme_excerpt": readme_content or "",
+                "stars": getattr(repo, "stars", 0),
+                "forks": getattr(repo, "forks", 0),
+                "is_archived": getattr(repo, "is_archived", False),
+                "recent_commits": commits_count,
+                "activity_summary": activity_summary,
+            },
+        )
+
+    # A BatchAnalyzerPort overlaps the LLM calls; otherwise analyze in turn
+    if batched:
+        return analyzer.analyze_many(repo_datas)
+    return [analyzer.analyze(repo_data) for repo_data in repo_datas]
@@ -112,11 +112,14 @@ class ApplicationFactory:
             progress_reporter.set_progress_callback(progress_callback)
 
         # Create services
+        cache_dir = os.path.expanduser(settings.cache_dir)
         github_service = GitHubService(
             settings.github_username,
             settings.github_token,
             rate_limiter=github_limiter,
             logger=logger,
+            cache_path=os.path.join(cache_dir, "github_http"),
+            readme_cache_path=os.path.join(cache_dir, "readmes.sqlite3"),
         )
 
         # Create analyzer using the LangChainClaudeAdapter (implements AnalyzerPort)
@@ -126,8 +129,11 @@ class ApplicationFactory:
             temperature=settings.llm_temperature,
             thinking_enabled=settings.llm_thinking_enabled,
             thinking_budget=settings.llm_thinking_budget,
+            speculate_above_tokens=settings.llm_speculate_above_tokens,
             rate_limiter=llm_limiter,
             logger=logger,
+            analysis_cache_path=os.path.join(cache_dir, "analyses.sqlite3"),
+            force_refresh=force_analysis,
         )
 
         # Create application runner
@@ -6,9 +6,11 @@ to provide a simple interface to the complex subsystem of services.
 """
 
 import concurrent.futures
+import datetime
 import os
 import sys
 import time
+import traceback
 from threading import Lock
 from typing import Any
 
@@ -110,12 +112,10 @@ class ApplicationRunner:
                     "updated_at",
                 )
                 if updated_at_str:
-                    import datetime as _dt
-
                     # Remove a trailing "Z" if present to satisfy fromisoformat.
                     updated_at_str = updated_at_str.rstrip("Z")
-                    repo_updated_ts = _dt.datetime.fromisoformat(updated_at_str)
-                    report_mtime_ts = _dt.datetime.fromtimestamp(
+                    repo_updated_ts = datetime.datetime.fromisoformat(updated_at_str)
+                    report_mtime_ts = datetime.datetime.fromtimestamp(
                         os.path.getmtime(repo_file_path),
                     )
 
@@ -171,8 +171,6 @@ class ApplicationRunner:
                 f"Exception in analyze_repo_task for {repo_name}: {type(e).__name__}: {e!s}",
                 level="error",
             )
-            import traceback
-
             self.logger.log(
                 f"Traceback (analyze_repo_task for {repo_name}):\n{traceback.format_exc()}",
                 level="debug",
@@ -233,13 +231,21 @@ class ApplicationRunner:
             f"API Retries: {stats.get('retries', 0)}"
         )
 
+    def close(self) -> None:
+        """Release the connections and caches held by the services."""
+        for service in (self.analyzer, self.github_service):
+            close = getattr(service, "close", None)
+            if close is not None:
+                close()
+
     def run(self, progress_callback=None):
         """Run the repository analysis process.
 
         This method coordinates the overall repository analysis workflow,
         using the Repository Analyzer Service to process each repository.
         It follows the Command pattern by encapsulating and executing the
-        entire repository analysis process.
+        entire repository analysis process.  The services are closed when
+        the run ends, however it ends.
 
         Args:
             progress_callback: Optional callback function to report progress
@@ -247,6 +253,13 @@ class ApplicationRunner:
         Returns:
             Dictionary with analysis results
         """
+        try:
+            return self._run(progress_callback)
+        finally:
+            self.close()
+
+    def _run(self, progress_callback):
+        """Carry out ``run`` without releasing the services afterwards."""
         # Set progress callback if provided
         if progress_callback:
             self.progress_reporter.set_progress_callback(progress_callback)
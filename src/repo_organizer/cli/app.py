@@ -8,7 +8,6 @@ import os
 import time
 from enum import Enum
 from pathlib import Path
-from typing import Optional
 
 import typer
 from rich.console import Console
@@ -50,6 +49,9 @@ class ActionType(str, Enum):
     ALL = "all"
 
 
+# Summary report icon per estimated value; anything else counts as high
+_VALUE_ICONS = {"Low": "🔴", "Medium": "🟡"}
+
 # Create Typer app with rich integration
 app = typer.Typer(
     name="repo",
@@ -71,6 +73,21 @@ app.add_typer(actions_app, name="actions")
 app.add_typer(dev_app, name="dev")
 
 
+def _write_report(path: Path, parts: list[str]) -> None:
+    """Write the report assembled in *parts* to *path* as UTF-8.
+
+    The text is encoded once and handed to ``os.write`` directly, skipping
+    the buffered text-file layer.
+    """
+    data = memoryview("".join(parts).encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
 def version_callback(value: bool):
     """Display version information and exit."""
     if value:
@@ -143,6 +160,11 @@ def analyze(
         "-s",
         help="Process only a single repository by name.",
     ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Submit analyses as one Anthropic message batch (half price, slower).",
+    ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug logging."),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimize console output."),
     username: str = None,  # Added by with_auth_option, manually included here for clarity
@@ -221,11 +243,13 @@ def analyze(
         llm_lim = RateLimiter(settings.llm_rate_limit, name="LLM")
 
         # Create adapters using DDD approach
+        cache_dir = Path(settings.cache_dir).expanduser()
         github = GitHubRestAdapter(
             github_username=owner,
             github_token=settings.github_token,
             rate_limiter=github_lim,
             logger=logger,
+            readme_cache_path=str(cache_dir / "readmes.sqlite3"),
         )
 
         llm = LangChainClaudeAdapter(
@@ -234,8 +258,12 @@ def analyze(
             temperature=settings.llm_temperature,
             thinking_enabled=settings.llm_thinking_enabled,
             thinking_budget=settings.llm_thinking_budget,
+            speculate_above_tokens=settings.llm_speculate_above_tokens,
             rate_limiter=llm_lim,
             logger=logger,
+            analysis_cache_path=str(cache_dir / "analyses.sqlite3"),
+            force_refresh=force,
+            use_message_batches=batch,
         )
 
     # Start the repository analysis
@@ -275,6 +303,7 @@ def analyze(
                 github,
                 llm,
                 single_repo=settings.single_repo,
+                batched=True,
             )
             progress.update(
                 fetch_task,
@@ -294,6 +323,8 @@ def analyze(
             # Write markdown files for each repository analysis
             success_count = 0
             fail_count = 0
+            # Summary entries are collected in the same pass as the reports
+            summary_entries: list[str] = []
 
             for i, a in enumerate(analyses):
                 path = output_path / f"{a.repo_name}.md"
@@ -307,90 +338,86 @@ def analyze(
                     details=details,
                 )
 
+                # Assemble the report in memory and write it in one call
+                parts = [f"# {a.repo_name}\n\n## Summary\n\n{a.summary}\n\n"]
+                add = parts.append
+                # Shared by the report and its summary entry, so built once
+                assessment = (
+                    f"- **Activity**: {a.activity_assessment}\n"
+                    f"- **Value**: {a.estimated_value}\n"
+                    f"- **Tags**: {', '.join(a.tags)}\n"
+                )
+                succeeded = "error" not in a.tags and "analysis-failed" not in a.tags
+                if succeeded:
+                    # Only write these sections for successful analyses
+                    add("## Strengths\n\n")
+                    for strength in a.strengths:
+                        add(f"- {strength}\n")
+                    add("\n")
+
+                    add("## Weaknesses\n\n")
+                    for weakness in a.weaknesses:
+                        add(f"- {weakness}\n")
+                    add("\n")
+
+                    if a.recommendations:
+                        add("## Recommendations\n\n")
+                        for rec in a.recommendations:
+                            add(f"- **{rec.recommendation}** ({rec.priority} Priority)  \n")
+                            add(f"  *Reason: {rec.reason}*\n")
+                        add("\n")
+
+                    add("## Assessment\n\n")
+                    add(assessment)
+                else:
+                    add(f"**Analysis failed**: {a.summary}\n")
+
+                value_icon = _VALUE_ICONS.get(a.estimated_value, "🟢")
+                status = "✅" if succeeded else "❌"
+                summary_entries.append(
+                    f"### {a.repo_name} {value_icon} {status}\n\n_{a.summary}_\n\n{assessment}\n",
+                )
+
                 try:
-                    with open(path, "w") as f:
-                        f.write(f"# {a.repo_name}\n\n")
-                        f.write("## Summary\n\n")
-                        f.write(f"{a.summary}\n\n")
-
-                        if "error" not in a.tags and "analysis-failed" not in a.tags:
-                            # Only write these sections for successful analyses
-                            f.write("## Strengths\n\n")
-                            for strength in a.strengths:
-                                f.write(f"- {strength}\n")
-                            f.write("\n")
-
-                            f.write("## Weaknesses\n\n")
-                            for weakness in a.weaknesses:
-                                f.write(f"- {weakness}\n")
-                            f.write("\n")
-
-                            if a.recommendations:
-                                f.write("## Recommendations\n\n")
-                                for rec in a.recommendations:
-                                    f.write(
-                                        f"- **{rec.recommendation}** ({rec.priority} Priority)  \n",
-                                    )
-                                    f.write(f"  *Reason: {rec.reason}*\n")
-                                f.write("\n")
-
-                            f.write("## Assessment\n\n")
-                            f.write(f"- **Activity**: {a.activity_assessment}\n")
-                            f.write(f"- **Value**: {a.estimated_value}\n")
-                            f.write(f"- **Tags**: {', '.join(a.tags)}\n")
-                            success_count += 1
-                        else:
-                            f.write(f"**Analysis failed**: {a.summary}\n")
-                            fail_count += 1
+                    _write_report(path, parts)
                 except Exception as e:
                     console.print(f"[red]Error writing report for {a.repo_name}: {e}")
                     fail_count += 1
+                else:
+                    if succeeded:
+                        success_count += 1
+                    else:
+                        fail_count += 1
 
             # Create summary report
-            summary_path = output_path / "repositories_report.md"
-            with open(summary_path, "w") as f:
-                # Add single repo mode indicator if applicable
-                if settings.single_repo:
-                    f.write("# Single Repository Analysis Report\n\n")
-                    f.write(
-                        f"*This report contains analysis for a single repository: **{settings.single_repo}**.*\n\n",
-                    )
-                else:
-                    f.write("# Repository Analysis Summary\n\n")
+            parts = []
+            add = parts.append
+            # Add single repo mode indicator if applicable
+            if settings.single_repo:
+                add("# Single Repository Analysis Report\n\n")
+                add(
+                    f"*This report contains analysis for a single repository: **{settings.single_repo}**.*\n\n",
+                )
+            else:
+                add("# Repository Analysis Summary\n\n")
 
-                f.write("## Overview\n\n")
-                f.write(f"- **Total Repositories**: {len(analyses)}\n")
-                f.write(f"- **Successfully Analyzed**: {success_count}\n")
-                f.write(f"- **Failed Analyses**: {fail_count}\n")
+            add("## Overview\n\n")
+            add(f"- **Total Repositories**: {len(analyses)}\n")
+            add(f"- **Successfully Analyzed**: {success_count}\n")
+            add(f"- **Failed Analyses**: {fail_count}\n")
 
-                # Add mode information
-                if settings.single_repo:
-                    f.write(
-                        f"- **Mode**: Single repository analysis of **{settings.single_repo}**\n",
-                    )
-                else:
-                    f.write("- **Mode**: Full repository analysis\n")
-                f.write("\n")
-
-                f.write("## Repositories\n\n")
-
-                for a in analyses:
-                    value_icon = (
-                        "🔴"
-                        if a.estimated_value == "Low"
-                        else "🟡"
-                        if a.estimated_value == "Medium"
-                        else "🟢"
-                    )
-                    status = (
-                        "✅" if "error" not in a.tags and "analysis-failed" not in a.tags else "❌"
-                    )
+            # Add mode information
+            if settings.single_repo:
+                add(f"- **Mode**: Single repository analysis of **{settings.single_repo}**\n")
+            else:
+                add("- **Mode**: Full repository analysis\n")
+            add("\n")
+
+            add("## Repositories\n\n")
+            parts.extend(summary_entries)
 
-                    f.write(f"### {a.repo_name} {value_icon} {status}\n\n")
-                    f.write(f"_{a.summary}_\n\n")
-                    f.write(f"- **Activity**: {a.activity_assessment}\n")
-                    f.write(f"- **Value**: {a.estimated_value}\n")
-                    f.write(f"- **Tags**: {', '.join(a.tags)}\n\n")
+            summary_path = output_path / "repositories_report.md"
+            _write_report(summary_path, parts)
 
             # Show final results
             if not quiet:
@@ -436,6 +463,9 @@ def analyze(
 
                 console.print(traceback.format_exc())
             raise typer.Exit(code=1)
+        finally:
+            llm.close()
+            github.close()
 
 
 @app.command()
@@ -9,6 +9,7 @@ from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
@@ -21,6 +22,8 @@ from repo_organizer.utils.rate_limiter import RateLimiter
 # Create console for rich output
 console = Console()
 
+_ACTION_ITEMS_HEADING = "## Action Items"
+
 
 def _load_analyses(settings: Settings) -> list[RepoAnalysis]:
     """Load existing repository analyses from output directory.
@@ -51,6 +54,9 @@ def _load_analyses(settings: Settings) -> list[RepoAnalysis]:
 
     console.print(f"Found {len(md_files)} repository analyses")
 
+    # Collect per-file errors and print them once after the loop
+    errors: list[str] = []
+
     # Load each analysis
     for md_file in md_files:
         try:
@@ -62,17 +68,19 @@ def _load_analyses(settings: Settings) -> list[RepoAnalysis]:
             with open(md_file) as f:
                 content = f.read()
 
-                # Look for action in the file
-                if "## Action Items" in content:
-                    action_section = content.split("## Action Items")[1].split("##")[0]
-                    if "archive" in action_section.lower():
+                # Look for action in the file; slice the section out by
+                # offset rather than splitting the whole document.
+                start = content.find(_ACTION_ITEMS_HEADING)
+                if start != -1:
+                    start += len(_ACTION_ITEMS_HEADING)
+                    end = content.find("##", start)
+                    action_section = content[start : end if end != -1 else None].lower()
+                    if "archive" in action_section:
                         action = "ARCHIVE"
-                    elif "delete" in action_section.lower():
+                    elif "delete" in action_section:
                         action = "DELETE"
 
-                # Create a minimal analysis object
-                from repo_organizer.domain.analysis.models import RepoAnalysis
-
+                # Create a minimal analysis object carrying the action
                 analysis = RepoAnalysis(
                     repo_name=repo_name,
                     summary="",
@@ -82,15 +90,16 @@ def _load_analyses(settings: Settings) -> list[RepoAnalysis]:
                     activity_assessment="",
                     estimated_value="",
                     tags=[],
+                    recommended_action=action,
+                    action_reasoning=reasoning,
                 )
 
-                # Monkey-patch the analysis object with the action
-                analysis.recommended_action = action
-                analysis.action_reasoning = reasoning
-
                 analyses.append(analysis)
         except Exception as e:
-            console.print(f"[red]Error loading analysis {md_file}: {e}[/]")
+            errors.append(f"[red]Error loading analysis {md_file}: {e}[/]")
+
+    if errors:
+        console.print("\n".join(errors))
 
     return analyses
 
@@ -175,7 +184,7 @@ def execute_actions(
     table.add_column("Action", style="green")
 
     for analysis in filtered_analyses:
-        action = getattr(analysis, "recommended_action", "KEEP")
+        action = analysis.recommended_action
         table.add_row(analysis.repo_name, action)
 
     console.print(table)
@@ -206,10 +215,13 @@ def execute_actions(
 
         success_count = 0
         error_count = 0
+        # Buffer per-repository output and print it in one go after the
+        # progress bar finishes instead of re-rendering on every line.
+        messages: list[str] = []
 
         for analysis in filtered_analyses:
             repo_name = analysis.repo_name
-            action = getattr(analysis, "recommended_action", "KEEP")
+            action = analysis.recommended_action
 
             progress.update(task, description=f"[cyan]Processing {repo_name}")
             logger.log(f"Processing {repo_name} for action: {action}", level="info")
@@ -219,41 +231,44 @@ def execute_actions(
                     # Simulate action execution
                     msg = f"Would execute {action} for {repo_name}"
                     logger.log(f"[DRY RUN] {msg}", level="info")
-                    console.print(f"[dry-run] {msg}")
+                    messages.append(escape(f"[dry-run] {msg}"))
                 # Actually execute the action
                 elif action == "DELETE":
                     # Delete repository logic
                     msg = f"Deleting {repo_name}..."
                     logger.log(msg, level="info")
-                    console.print(f"[red]{msg}[/]")
+                    messages.append(f"[red]{msg}[/]")
                     # In the future, we would use the GitHub REST API to delete the repository
                 elif action == "ARCHIVE":
                     # Archive repository logic
                     msg = f"Archiving {repo_name}..."
                     logger.log(msg, level="info")
-                    console.print(f"[yellow]{msg}[/]")
+                    messages.append(f"[yellow]{msg}[/]")
                     # In the future, we would use the GitHub REST API to archive the repository
                 elif action == "EXTRACT":
                     # Extract repository logic
                     msg = f"Extracting valuable parts from {repo_name}..."
                     logger.log(msg, level="info")
-                    console.print(f"[blue]{msg}[/]")
+                    messages.append(f"[blue]{msg}[/]")
                     # In the future, we would extract valuable parts before archiving/deleting
                 elif action == "PIN":
                     # Pin repository logic
                     msg = f"Pinning {repo_name}..."
                     logger.log(msg, level="info")
-                    console.print(f"[green]{msg}[/]")
+                    messages.append(f"[green]{msg}[/]")
                     # In the future, we would use the GitHub REST API to pin the repository
                 success_count += 1
             except Exception as e:
                 error_msg = f"Error executing {action} for {repo_name}: {e}"
                 logger.log(error_msg, level="error")
-                console.print(f"[red]{error_msg}[/]")
+                messages.append(f"[red]{error_msg}[/]")
                 error_count += 1
 
             progress.update(task, advance=1)
 
+    if messages:
+        console.print("\n".join(messages))
+
     # Print summary
     if dry_run:
         msg = "Dry run completed successfully"
@@ -144,6 +144,7 @@ def analyze(
             temperature=settings.llm_temperature,
             thinking_enabled=settings.llm_thinking_enabled,
             thinking_budget=settings.llm_thinking_budget,
+            speculate_above_tokens=settings.llm_speculate_above_tokens,
             rate_limiter=llm_lim,
             logger=logger,
         )
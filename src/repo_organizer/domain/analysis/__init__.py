@@ -8,7 +8,7 @@ from .events import (
     RepositoryAnalysisCompleted,
 )
 from .models import Recommendation, RepoAnalysis
-from .protocols import AnalyzerPort
+from .protocols import AnalyzerPort, AsyncAnalyzerPort
 from .repository_analyzer_service import RepositoryAnalyzerService
 from .services import AnalysisService
 from .value_objects import (
@@ -27,6 +27,7 @@ __all__ = [
     "AnalysisService",
     # Protocols
     "AnalyzerPort",
+    "AsyncAnalyzerPort",
     "HighPriorityIssueIdentified",
     "PriorityLevel",
     "Recommendation",
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
     from .models import RepoAnalysis
 
@@ -19,3 +19,17 @@ class AnalyzerPort(Protocol):
         ``repo_data`` is a *flat* mapping prepared by the application layer.
         The exact keys are an implementation detail of the adapter.
         """
+
+
+class AsyncAnalyzerPort(Protocol):
+    """Analyzer that can await the analysis instead of blocking a thread."""
+
+    async def analyze_async(self, repo_data: Mapping[str, object]) -> RepoAnalysis:
+        """Return analysis for *repo_data*, as ``AnalyzerPort.analyze`` does."""
+
+
+class BatchAnalyzerPort(Protocol):
+    """Analyzer that can work on several repositories at once."""
+
+    def analyze_many(self, repos: Sequence[Mapping[str, object]]) -> list[RepoAnalysis]:
+        """Return one analysis per mapping in *repos*, in input order."""
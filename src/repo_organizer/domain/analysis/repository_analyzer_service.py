@@ -7,6 +7,7 @@ of repositories using the analyzer and source control ports.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
 import os
@@ -32,6 +33,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default number of repositories analyzed at the same time
+MAX_CONCURRENT_ANALYSES = 4
+
 
 class RepositoryAnalyzerService:
     """Service that orchestrates repository analysis.
@@ -50,6 +54,7 @@ class RepositoryAnalyzerService:
         debug: bool = False,
         repo_filter: Callable[[Repository], bool] | None = None,
         force_reanalyze: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_ANALYSES,
     ):
         """Initialize the repository analyzer service.
 
@@ -61,6 +66,7 @@ class RepositoryAnalyzerService:
             debug: Whether to enable debug logging
             repo_filter: Optional filter function for repositories
             force_reanalyze: Whether to reanalyze repositories that already have reports
+            max_concurrency: Maximum number of repositories analyzed at once
         """
         self.output_dir = Path(output_dir)
         self.source_control_port = source_control_port
@@ -69,10 +75,14 @@ class RepositoryAnalyzerService:
         self.debug = debug
         self.repo_filter = repo_filter
         self.force_reanalyze = force_reanalyze
+        self.max_concurrency = max_concurrency
 
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # Names of repositories with a report on disk, scanned on first use
+        self._existing_reports: set[str] | None = None
+
         # Configure logging
         if debug:
             logging.basicConfig(level=logging.DEBUG)
@@ -90,17 +100,29 @@ class RepositoryAnalyzerService:
         """
         # Skip if filtered out
         if self.repo_filter and not self.repo_filter(repo):
-            logger.debug(f"Skipping {repo.name} - filtered out")
+            logger.debug("Skipping %s - filtered out", repo.name)
             return False
 
         # Check if report already exists
-        report_path = self.output_dir / f"{repo.name}.json"
-        if report_path.exists() and not self.force_reanalyze:
-            logger.debug(f"Skipping {repo.name} - report exists")
+        if not self.force_reanalyze and self._report_exists(repo.name):
+            logger.debug("Skipping %s - report exists", repo.name)
             return False
 
         return True
 
+    def _report_exists(self, repo_name: str) -> bool:
+        """Check whether a report for *repo_name* is already in the output directory.
+
+        The directory is listed once and the result kept in memory, instead of
+        a ``stat`` per repository; ``write_report`` keeps it up to date.
+        """
+        if self._existing_reports is None:
+            with os.scandir(self.output_dir) as entries:
+                self._existing_reports = {
+                    entry.name[: -len(".json")] for entry in entries if entry.name.endswith(".json")
+                }
+        return repo_name in self._existing_reports
+
     async def analyze_repository(self, repo: Repository) -> RepoAnalysis | None:
         """Analyze a single repository.
 
@@ -111,24 +133,36 @@ class RepositoryAnalyzerService:
             The repository analysis if successful, None if analysis fails
         """
         try:
-            logger.info(f"Analyzing repository: {repo.name}")
-
-            # Fetch additional data
-            languages = self.source_control_port.fetch_languages(repo)
-            commits = self.source_control_port.recent_commits(repo, limit=20)
-            contributors = self.source_control_port.contributors(repo)
-
-            # Update repository with language data
-            if languages and not repo.languages:
-                repo = repo.with_languages(
-                    {lb.language: lb.percentage for lb in languages},
+            logger.info("Analyzing repository: %s", repo.name)
+
+            # Fetch additional data; the ports block on network I/O, so they run
+            # in worker threads to let other repositories proceed meanwhile.
+            # Languages are only looked up when the repository lacks them.
+            if not repo.languages:
+                languages = await asyncio.to_thread(
+                    self.source_control_port.fetch_languages,
+                    repo,
                 )
+                if languages:
+                    repo = repo.with_languages(
+                        {lb.language: lb.percentage for lb in languages},
+                    )
+            commits = await asyncio.to_thread(
+                self.source_control_port.recent_commits,
+                repo,
+                limit=20,
+            )
+            contributors = await asyncio.to_thread(self.source_control_port.contributors, repo)
 
             # Prepare data for analysis
             data = self.prepare_analysis_data(repo, commits, contributors)
 
-            # Run analysis
-            analysis = self.analyzer_port.analyze(data)
+            # Run analysis, awaiting it directly when the analyzer supports that
+            analyze_async = getattr(self.analyzer_port, "analyze_async", None)
+            if inspect.iscoroutinefunction(analyze_async):
+                analysis = await analyze_async(data)
+            else:
+                analysis = await asyncio.to_thread(self.analyzer_port.analyze, data)
 
             # Publish domain event
             await event_bus.dispatch(
@@ -234,42 +268,68 @@ class RepositoryAnalyzerService:
         with open(report_path, "w") as f:
             json.dump(report_data, f, indent=2)
 
-        logger.debug(f"Wrote report to {report_path}")
+        if self._existing_reports is not None:
+            self._existing_reports.add(repo_name)
+
+        logger.debug("Wrote report to %s", report_path)
 
     async def generate_reports(self, repos: Sequence[Repository]) -> list[RepoAnalysis]:
         """Generate analysis reports for multiple repositories.
 
+        Up to ``max_concurrency`` repositories are analyzed at the same time,
+        overlapping their GitHub and LLM round trips.
+
         Args:
             repos: The repositories to analyze
 
         Returns:
             List of successful analyses
         """
-        analyses = []
+        selected = []
         count = 0
-        tasks = []
 
         for repo in repos:
             # Check max repos limit
             if self.max_repos and count >= self.max_repos:
-                logger.info(f"Reached max repos limit of {self.max_repos}")
+                logger.info("Reached max repos limit of %s", self.max_repos)
                 break
 
             # Check if repo should be analyzed
             if not self.should_analyze_repo(repo):
                 continue
 
-            # Analyze repo (create task)
-            tasks.append(self.analyze_repository(repo))
+            selected.append(repo)
             count += 1
 
-        # Run all analyses in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return await self.analyze_repositories(selected)
 
-        # Process results
+    async def analyze_repositories(self, repos: Sequence[Repository]) -> list[RepoAnalysis]:
+        """Analyze repositories concurrently, writing a report for each.
+
+        Up to ``max_concurrency`` analyses are in flight at once, which keeps
+        within the LLM rate limit while their round trips overlap.
+
+        Args:
+            repos: The repositories to analyze
+
+        Returns:
+            List of successful analyses, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(repo: Repository) -> RepoAnalysis | None:
+            async with semaphore:
+                return await self.analyze_repository(repo)
+
+        results = await asyncio.gather(
+            *(_bounded(repo) for repo in repos),
+            return_exceptions=True,
+        )
+
+        analyses = []
         for result in results:
             if isinstance(result, Exception):
-                logger.error(f"Analysis failed with exception: {result}")
+                logger.error("Analysis failed with exception: %s", result)
             elif result is not None:
                 analyses.append(result)
 
@@ -234,8 +234,10 @@ class AnalysisService:
         Returns:
             List of analyses with the specified tag
         """
+        # Lower-case the wanted tag once rather than once per analysis
+        wanted = tag.lower()
         return [
-            analysis for analysis in analyses if tag.lower() in [t.lower() for t in analysis.tags]
+            analysis for analysis in analyses if any(t.lower() == wanted for t in analysis.tags)
         ]
 
     @staticmethod
@@ -7,6 +7,10 @@ before executing operations.
 import re
 from dataclasses import dataclass
 
+# GitHub usernames: alphanumeric first character, then letters, numbers,
+# hyphens or underscores.
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9][-a-zA-Z0-9_]*$")
+
 
 @dataclass
 class ValidationResult:
@@ -50,9 +54,7 @@ def validate_username(username: str | None) -> ValidationResult:
         )
 
     # Check username format (alphanumeric with optional hyphens, underscores)
-    # GitHub usernames allow alphanumeric characters and hyphens
-    pattern = r"^[a-zA-Z0-9][-a-zA-Z0-9_]*$"
-    if not re.match(pattern, username):
+    if not _USERNAME_RE.match(username):
         return ValidationResult(
             is_valid=False,
             error_message="Username must start with a letter or number and can only contain letters, numbers, hyphens (-), and underscores (_)",
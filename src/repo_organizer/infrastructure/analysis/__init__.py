@@ -6,6 +6,7 @@ bounded context.
 
 from repo_organizer.infrastructure.analysis.pydantic_models import (
     Commit,
+    CommitBatch,
     Contributor,
     LanguageBreakdown,
     RepoAnalysis,
@@ -15,6 +16,7 @@ from repo_organizer.infrastructure.analysis.pydantic_models import (
 
 __all__ = [
     "Commit",
+    "CommitBatch",
     "Contributor",
     "LanguageBreakdown",
     "RepoAnalysis",
@@ -0,0 +1,93 @@
+"""On-disk cache of LLM repository analyses keyed by their input.
+
+Between runs most repositories are unchanged, yet each one would otherwise be
+sent to the model again.  The analysis input (name, README excerpt, stats,
+languages, ...) is canonicalised and hashed with BLAKE2b; an identical input
+within the TTL is answered from disk instead of invoking the chain.  Any change
+to the repository data produces a new key, so stale analyses are never served
+for modified repositories.  The key also covers the settings that shape an
+analysis (model, prompt version, ...), so changing those misses the cache too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Analyses are far more expensive than API metadata, so they live for a week.
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    key TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+"""
+
+
+def analysis_key(repo_data: dict[str, Any], context: Mapping[str, Any] | None = None) -> str:
+    """Return the content hash identifying the analysis input *repo_data*.
+
+    *context* holds whatever else determines the analysis, such as the model
+    name and prompt version; entries that differ yield a different key.
+    """
+    canonical = json.dumps(
+        [context or {}, repo_data],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+
+
+class AnalysisCache:
+    """Thread-safe SQLite store of serialized ``RepoAnalysis`` JSON."""
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL_SECONDS):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database filename; parent directories are created as
+                needed.
+            ttl: Seconds for which a stored analysis is reused.
+        """
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached analysis JSON for *key*, or ``None`` if absent or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT analysis, stored_at FROM analyses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return row[0]
+
+    def put(self, key: str, analysis_json: str) -> None:
+        """Store *analysis_json* under *key*."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (key, analysis, stored_at) VALUES (?, ?, ?)",
+                (key, analysis_json, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
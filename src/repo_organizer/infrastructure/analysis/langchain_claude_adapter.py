@@ -10,18 +10,28 @@ import time
 from typing import TYPE_CHECKING, Any
 
 from repo_organizer.domain.analysis.models import RepoAnalysis
-from repo_organizer.domain.analysis.protocols import AnalyzerPort
-from repo_organizer.infrastructure.analysis.llm_service import LLMService
+from repo_organizer.domain.analysis.protocols import (
+    AnalyzerPort,
+    AsyncAnalyzerPort,
+    BatchAnalyzerPort,
+)
+from repo_organizer.infrastructure.analysis.llm_service import (
+    BATCH_TIMEOUT,
+    MAX_CONCURRENT_ANALYSES,
+    LLMService,
+    run_sync,
+)
 from repo_organizer.utils.exceptions import LLMServiceError, RateLimitExceededError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping, Sequence
 
+    from repo_organizer.infrastructure.analysis import pydantic_models
     from repo_organizer.utils.logger import Logger
     from repo_organizer.utils.rate_limiter import RateLimiter
 
 
-class LangChainClaudeAdapter(AnalyzerPort):
+class LangChainClaudeAdapter(AnalyzerPort, AsyncAnalyzerPort, BatchAnalyzerPort):
     """Adapter that implements the AnalyzerPort using LangChain and Claude.
 
     This adapter uses composition rather than inheritance, properly separating
@@ -45,6 +55,11 @@ class LangChainClaudeAdapter(AnalyzerPort):
         logger: Logger | None = None,
         enable_caching: bool = True,
         cache_ttl: int = 3600,  # 1 hour cache by default
+        analysis_cache_path: str | None = None,
+        force_refresh: bool = False,
+        use_message_batches: bool = False,
+        batch_timeout: float = BATCH_TIMEOUT,
+        speculate_above_tokens: int | None = None,
     ):
         """Initialize with extended thinking support.
 
@@ -64,6 +79,16 @@ class LangChainClaudeAdapter(AnalyzerPort):
             logger: Optional logger
             enable_caching: Whether to enable result caching
             cache_ttl: Time-to-live for cached results in seconds
+            analysis_cache_path: Optional SQLite file persisting analyses of
+                unchanged repositories across runs
+            force_refresh: Bypass the persistent analysis cache
+            use_message_batches: Send ``analyze_many`` work through the
+                Message Batches API (half price, completes asynchronously)
+            batch_timeout: Seconds to wait for a message batch before
+                cancelling it
+            speculate_above_tokens: README size (in tokens) above which async
+                analyses race a strict JSON call, paying for both; ``None``
+                disables it
         """
         # Use composition instead of inheritance
         self._llm_service = LLMService(
@@ -74,6 +99,8 @@ class LangChainClaudeAdapter(AnalyzerPort):
             thinking_budget=thinking_budget,
             rate_limiter=rate_limiter,
             logger=logger,
+            cache_path=analysis_cache_path,
+            speculate_above_tokens=speculate_above_tokens,
         )
 
         # Store additional configuration
@@ -83,6 +110,9 @@ class LangChainClaudeAdapter(AnalyzerPort):
         self.request_timeout = request_timeout
         self.enable_caching = enable_caching
         self.cache_ttl = cache_ttl
+        self.force_refresh = force_refresh
+        self.use_message_batches = use_message_batches
+        self.batch_timeout = batch_timeout
 
         # Extended LLM parameters - will be used when we pass them to LLMService
         self.max_tokens = max_tokens
@@ -164,11 +194,17 @@ class LangChainClaudeAdapter(AnalyzerPort):
                 "debug",
             )
 
+    def _progress_callback(self) -> Callable[[str, str], None] | None:
+        """Return the streaming progress callback, or ``None`` unless debugging."""
+        if self.logger and getattr(self.logger, "debug_enabled", False):
+            return self._report_thinking_progress
+        return None
+
     def _report_thinking_progress(self, repo_name: str, thinking_text: str) -> None:
         """Report thinking progress from the LLM.
 
-        This method can be used to handle thinking progress streaming from the LLM
-        if that feature becomes available in LangChain/Anthropic.
+        Async analyses are streamed through this method when debug logging is
+        enabled, so long generations show progress as they happen.
 
         Args:
             repo_name: Name of the repository being analyzed
@@ -329,7 +365,10 @@ class LangChainClaudeAdapter(AnalyzerPort):
 
                 # Use the LLM service to get a Pydantic model
                 # Pass validated data_dict to ensure all fields are available in the correct format
-                pyd_model = self._llm_service.analyze_repository(data_dict)
+                pyd_model = self._llm_service.analyze_repository(
+                    data_dict,
+                    force_refresh=self.force_refresh,
+                )
 
                 # Track response time
                 response_time = time.time() - start_time
@@ -453,6 +492,10 @@ class LangChainClaudeAdapter(AnalyzerPort):
         """
         return dict(self._metrics)
 
+    def close(self) -> None:
+        """Release the SDK connections and the analysis cache."""
+        self._llm_service.close()
+
     # ------------------------------------------------------------------
     # AnalyzerPort implementation
     # ------------------------------------------------------------------
@@ -617,3 +660,147 @@ class LangChainClaudeAdapter(AnalyzerPort):
                 estimated_value="Unknown (analysis failed)",
                 tags=["error", "analysis-failed"],
             )
+
+    async def analyze_async(self, repo_data: Mapping[str, Any]) -> RepoAnalysis:
+        """Analyze a repository without blocking the event loop.
+
+        The request is awaited through the LLM service's async chain, so many
+        repositories can wait on Claude from one event loop; with debug
+        logging enabled the response is streamed and reported as it arrives.
+        The service does not raise: a failed analysis comes back as its error
+        placeholder, which is counted as a failure and kept out of the cache
+        so a later call asks the model again.
+
+        Args:
+            repo_data: A mapping containing repository data
+
+        Returns:
+            A domain model RepoAnalysis object
+        """
+        repo_data_dict = dict(repo_data)
+        cache_key = self._get_cache_key(repo_data_dict) if self.enable_caching else None
+        if cache_key is not None:
+            self._clean_expired_cache()
+            if cache_key in self._cache:
+                self._metrics["cache_hits"] += 1
+                return self._cache[cache_key][0]
+            self._metrics["cache_misses"] += 1
+
+        start_time = time.time()
+        if (on_text := self._progress_callback()) is not None:
+            repo_name = repo_data_dict.get("repo_name", "unknown")
+            pyd_model = await self._llm_service.analyze_repository_stream(
+                repo_data_dict,
+                lambda text: on_text(repo_name, text),
+                force_refresh=self.force_refresh,
+            )
+        else:
+            pyd_model = await self._llm_service.analyze_repository_async(
+                repo_data_dict,
+                force_refresh=self.force_refresh,
+            )
+        return self._record_analysis(pyd_model, cache_key, time.time() - start_time)
+
+    async def analyze_many_async(
+        self,
+        repos: Sequence[Mapping[str, Any]],
+        concurrency: int = MAX_CONCURRENT_ANALYSES,
+    ) -> list[RepoAnalysis]:
+        """Analyze several repositories with up to *concurrency* LLM calls in flight.
+
+        Repositories in the in-memory cache are answered from it; the rest are
+        sent together through ``LLMService.analyze_many_async``.  Failed
+        analyses are counted and kept out of the cache as in ``analyze_async``.
+
+        Args:
+            repos: Mappings containing repository data
+            concurrency: Maximum number of analyses running at once
+
+        Returns:
+            One RepoAnalysis per repository, in input order
+        """
+        repo_dicts = [dict(repo_data) for repo_data in repos]
+        cache_keys: list[str | None] = [None] * len(repo_dicts)
+        results: list[RepoAnalysis | None] = [None] * len(repo_dicts)
+        if self.enable_caching:
+            self._clean_expired_cache()
+            for i, repo_data_dict in enumerate(repo_dicts):
+                cache_key = cache_keys[i] = self._get_cache_key(repo_data_dict)
+                if cache_key in self._cache:
+                    self._metrics["cache_hits"] += 1
+                    results[i] = self._cache[cache_key][0]
+                else:
+                    self._metrics["cache_misses"] += 1
+
+        pending = [i for i, analysis in enumerate(results) if analysis is None]
+        start_time = time.time()
+        pyd_models = await self._llm_service.analyze_many_async(
+            [repo_dicts[i] for i in pending],
+            concurrency,
+            force_refresh=self.force_refresh,
+            on_text=self._progress_callback(),
+        )
+        elapsed = time.time() - start_time
+        for i, pyd_model in zip(pending, pyd_models, strict=True):
+            results[i] = self._record_analysis(pyd_model, cache_keys[i], elapsed)
+        return results
+
+    def analyze_many(
+        self,
+        repos: Sequence[Mapping[str, Any]],
+        concurrency: int = MAX_CONCURRENT_ANALYSES,
+    ) -> list[RepoAnalysis]:
+        """Blocking wrapper around ``analyze_many_async`` for sync callers.
+
+        With ``use_message_batches`` set the repositories are sent through
+        ``analyze_batched`` instead.
+        """
+        if self.use_message_batches:
+            return self.analyze_batched(repos)
+        return run_sync(self.analyze_many_async(repos, concurrency))
+
+    def analyze_batched(self, repos: Sequence[Mapping[str, Any]]) -> list[RepoAnalysis]:
+        """Analyze several repositories through one Anthropic message batch.
+
+        Blocks until the batch ends or ``batch_timeout`` passes; see
+        ``LLMService.analyze_repositories_batched``.
+
+        Args:
+            repos: Mappings containing repository data
+
+        Returns:
+            One RepoAnalysis per repository, in input order
+        """
+        repo_dicts = [dict(repo_data) for repo_data in repos]
+        start_time = time.time()
+        pyd_models = self._llm_service.analyze_repositories_batched(
+            repo_dicts,
+            timeout=self.batch_timeout,
+            force_refresh=self.force_refresh,
+        )
+        elapsed = time.time() - start_time
+        return [
+            self._record_analysis(
+                pyd_model,
+                self._get_cache_key(repo_data_dict) if self.enable_caching else None,
+                elapsed,
+            )
+            for repo_data_dict, pyd_model in zip(repo_dicts, pyd_models, strict=True)
+        ]
+
+    def _record_analysis(
+        self,
+        pyd_model: pydantic_models.RepoAnalysis,
+        cache_key: str | None,
+        response_time: float,
+    ) -> RepoAnalysis:
+        """Convert an async result, update metrics and cache it unless it failed."""
+        analysis = RepoAnalysis.from_pydantic(pyd_model)
+        if "analysis-failed" in analysis.tags:
+            self._update_metrics(success=False)
+            return analysis
+
+        self._update_metrics(success=True, response_time=response_time)
+        if cache_key is not None:
+            self._cache[cache_key] = (analysis, time.time())
+        return analysis
@@ -3,16 +3,26 @@
 These models serve as the data transfer objects (DTOs) for the infrastructure layer.
 They provide validation and serialization/deserialization capabilities needed for
 interacting with external systems like LLMs and APIs.
+
+Only the models that are parsed from LLM output need Pydantic.  The plain
+records built in bulk from API responses and local git history (``RepoInfo``,
+``Commit``, ``Contributor`` and ``LanguageBreakdown``) are slotted, frozen
+dataclasses so that constructing thousands of them skips validation entirely.
 """
 
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
 from pydantic import BaseModel, Field
 
 
-class LanguageBreakdown(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LanguageBreakdown:
     """Breakdown of programming languages used in a repository."""
 
-    language: str = Field(description="Programming language name")
-    percentage: float = Field(description="Percentage of code in this language")
+    language: str  # Programming language name
+    percentage: float  # Percentage of code in this language
 
 
 class RepoRecommendation(BaseModel):
@@ -54,7 +64,8 @@ class RepoAnalysis(BaseModel):
     )
 
 
-class RepoInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RepoInfo:
     """Basic information about a GitHub repository."""
 
     name: str
@@ -66,7 +77,8 @@ class RepoInfo(BaseModel):
     forks: int = 0
 
 
-class Commit(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Commit:
     """Git commit information."""
 
     hash: str
@@ -75,7 +87,50 @@ class Commit(BaseModel):
     date: str
 
 
-class Contributor(BaseModel):
+@dataclass(slots=True)
+class CommitBatch:
+    """Column-oriented batch of git commits.
+
+    Each list holds one field for every commit, in the same order.  Scanning a
+    single column (e.g. sorting by date or counting authors) touches one
+    contiguous list instead of one object per commit.  Dates are kept as unix
+    timestamps and only formatted when ``Commit`` objects are materialised.
+    """
+
+    hashes: list[str] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+    authors: list[str] = field(default_factory=list)
+    dates: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def iter_commits(self) -> Iterator[Commit]:
+        """Lazily yield one ``Commit`` per row of the batch.
+
+        Local UTC offsets (and DST switches) are whole multiples of 15
+        minutes, so every timestamp in the same 900-second window falls on the
+        same local date.  Formatted dates are memoised per window, which skips
+        ``localtime``/``strftime`` for commits made close together.
+        """
+        strftime, localtime = time.strftime, time.localtime
+        dates_by_window: dict[int, str] = {}
+        for commit_hash, message, author, timestamp in zip(
+            self.hashes,
+            self.messages,
+            self.authors,
+            self.dates,
+            strict=True,
+        ):
+            window = timestamp // 900
+            date = dates_by_window.get(window)
+            if date is None:
+                date = dates_by_window[window] = strftime("%Y-%m-%d", localtime(timestamp))
+            yield Commit(hash=commit_hash, message=message, author=author, date=date)
+
+
+@dataclass(frozen=True, slots=True)
+class Contributor:
     """Repository contributor information."""
 
     name: str
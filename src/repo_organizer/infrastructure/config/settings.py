@@ -43,6 +43,13 @@ class Settings(BaseSettings):
         description="Enable extended thinking for LLM",
     )
     llm_thinking_budget: int = Field(16000, description="Token budget for LLM thinking")
+    llm_speculate_above_tokens: int | None = Field(
+        None,
+        description=(
+            "README tokens above which a strict JSON call races the main analysis "
+            "(each race pays for both calls)"
+        ),
+    )
 
     # Concurrency and rate limiting
     max_workers: int = Field(5, description="Number of parallel workers")
@@ -153,6 +160,11 @@ def load_settings(env_file: str | None = None) -> Settings:
         "llm_temperature": float(os.getenv("LLM_TEMPERATURE", "0.2")),
         "llm_thinking_enabled": os.getenv("LLM_THINKING_ENABLED", "true").lower() == "true",
         "llm_thinking_budget": int(os.getenv("LLM_THINKING_BUDGET", "16000")),
+        "llm_speculate_above_tokens": (
+            int(os.environ["LLM_SPECULATE_ABOVE_TOKENS"])
+            if os.getenv("LLM_SPECULATE_ABOVE_TOKENS")
+            else None
+        ),
         # Application settings
         "log_level": os.getenv("LOG_LEVEL", "INFO"),
         "cache_dir": os.getenv("CACHE_DIR", "~/.repo_organizer/cache"),
@@ -20,10 +20,15 @@ from repo_organizer.domain.source_control.models import (
     Repository,
 )
 from repo_organizer.domain.source_control.protocols import SourceControlPort
+from repo_organizer.infrastructure.source_control.readme_cache import ReadmeCache
+from repo_organizer.utils import fast_json
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+# ``max_bytes`` key under which untruncated READMEs are stored in the cache.
+_FULL_README = 0
+
 
 class GitHubRestAdapter(SourceControlPort):
     """Adapter that fulfils ``SourceControlPort`` using the GitHub REST API."""
@@ -34,6 +39,7 @@ class GitHubRestAdapter(SourceControlPort):
         github_token: str | None = None,
         rate_limiter=None,
         logger=None,
+        readme_cache_path: str | None = None,
     ):
         """Initialize the GitHub REST adapter.
 
@@ -42,17 +48,27 @@ class GitHubRestAdapter(SourceControlPort):
             github_token: GitHub token for authentication
             rate_limiter: Optional rate limiter
             logger: Optional logger
+            readme_cache_path: Optional SQLite file from which READMEs are
+                served without an API request; ``None`` disables it
         """
         self.github_username = github_username
         self.github_token = github_token
         self.rate_limiter = rate_limiter
         self.logger = logger
+        self._readme_cache = ReadmeCache(readme_cache_path) if readme_cache_path else None
 
         # Create session for requests
         self._session = requests.Session()
         if github_token:
             self._session.headers.update({"Authorization": f"token {github_token}"})
 
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the README cache."""
+        self._session.close()
+        if self._readme_cache is not None:
+            self._readme_cache.close()
+            self._readme_cache = None
+
     # ------------------------------------------------------------------
     # SourceControlPort implementation
     # ------------------------------------------------------------------
@@ -107,7 +123,7 @@ class GitHubRestAdapter(SourceControlPort):
                     )
                 break
 
-            batch = response.json()
+            batch = fast_json.loads(response.content)
             if not batch:
                 break
 
@@ -163,7 +179,7 @@ class GitHubRestAdapter(SourceControlPort):
                 )
             return {}
 
-        languages = response.json()
+        languages = fast_json.loads(response.content)
 
         # Calculate percentages
         total = sum(languages.values())
@@ -181,6 +197,18 @@ class GitHubRestAdapter(SourceControlPort):
         Returns:
             README content or empty string if not found
         """
+        if self._readme_cache is None:
+            return self._fetch_readme(repo_name)
+
+        readme = self._readme_cache.get(repo_name, _FULL_README)
+        if readme is None:
+            readme = self._fetch_readme(repo_name)
+            if readme:
+                self._readme_cache.put(repo_name, _FULL_README, readme)
+        return readme
+
+    def _fetch_readme(self, repo_name: str) -> str:
+        """Fetch the README from the API (see ``get_repository_readme``)."""
         if self.rate_limiter:
             self.rate_limiter.wait(self.logger)
 
@@ -200,7 +228,7 @@ class GitHubRestAdapter(SourceControlPort):
                     )
                 return ""
 
-            data = response.json()
+            data = fast_json.loads(response.content)
             content = data.get("content", "")
 
             if content:
@@ -288,13 +316,13 @@ class GitHubRestAdapter(SourceControlPort):
                     )
                 return []
 
-            commits_data = response.json()
+            commits_data = fast_json.loads(response.content)
 
             commits = []
             for commit_data in commits_data[:limit]:
                 commit = Commit(
                     hash=commit_data.get("sha", "")[:7],
-                    message=commit_data.get("commit", {}).get("message", "").split("\n")[0],
+                    message=commit_data.get("commit", {}).get("message", "").partition("\n")[0],
                     author=commit_data.get("commit", {}).get("author", {}).get("name", "Unknown"),
                     date=commit_data.get("commit", {}).get("author", {}).get("date", ""),
                 )
@@ -333,7 +361,7 @@ class GitHubRestAdapter(SourceControlPort):
                     )
                 return []
 
-            contributors_data = response.json()
+            contributors_data = fast_json.loads(response.content)
 
             contributors = []
             for contributor_data in contributors_data:
@@ -13,30 +13,268 @@ unchanged.
 
 from __future__ import annotations
 
-import base64
 import datetime
-import json
 import os
+import random
 import re
 import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-import git
 import requests
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
 )
+from urllib3.util.request import ACCEPT_ENCODING
 
-from repo_organizer.infrastructure.analysis.pydantic_models import Commit, Contributor
+from repo_organizer.infrastructure.analysis.pydantic_models import (
+    Commit,
+    CommitBatch,
+    Contributor,
+)
+from repo_organizer.infrastructure.source_control.http_cache import (
+    DEFAULT_TTL_SECONDS,
+    CachedResponse,
+    ConditionalRequestCache,
+)
+from repo_organizer.infrastructure.source_control.rate_limited_adapter import (
+    RateLimitedAdapter,
+    retry_after_seconds,
+)
+from repo_organizer.infrastructure.source_control.readme_cache import ReadmeCache
+from repo_organizer.utils import fast_json
 from repo_organizer.utils.exceptions import APIError
+from repo_organizer.utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from tenacity import RetryCallState
+
     from repo_organizer.utils.logger import Logger
     from repo_organizer.utils.rate_limiter import RateLimiter
 
+# Upper bound on concurrent GitHub requests, e.g. parallel listing pages.
+# GitHub asks integrations to avoid large bursts of parallel requests.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Keep-alive connections held for api.github.com.  urllib3 defaults to 10,
+# which makes a parallel caller above that size open and discard sockets
+# (each one a fresh TCP + TLS handshake) instead of reusing them.
+_POOL_MAXSIZE = 32
+
+# Entries kept by the per-service in-process memo of languages / READMEs.
+_MEMO_MAXSIZE = 1024
+
+# Retry policy for the REST helpers: three attempts with "full jitter"
+# exponential back-off (a random delay up to 2, 4, ... capped at 30 seconds) so
+# parallel workers hitting the same 403/5xx storm do not retry in lock-step.
+# A ``Retry-After`` / ``X-RateLimit-Reset`` hint from GitHub takes precedence,
+# bounded by ``RETRY_AFTER_CAP``.
+_RETRY_ATTEMPTS = 3
+_RETRY_MAX_WAIT = 30.0
+
+
+def _backoff_delay(attempt: int, exc: BaseException | None) -> float:
+    """Return the sleep before retry number *attempt* (0-based) after *exc*."""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(_RETRY_MAX_WAIT, 2.0 ** (attempt + 1)))
+
+
+def _tenacity_wait(retry_state: RetryCallState) -> float:
+    """Tenacity ``wait`` callable applying ``_backoff_delay``."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    return _backoff_delay(retry_state.attempt_number - 1, exc)
+
+
+def _with_retry[T](
+    fn: Callable[..., T],
+    *args: Any,
+    _attempts: int = _RETRY_ATTEMPTS,
+    **kwargs: Any,
+) -> T:
+    """Call *fn* and retry it on ``APIError`` with jittered exponential back-off.
+
+    Unlike a tenacity decorator this allocates no per-call retry state, so the
+    common successful call costs a single plain function call.
+    """
+    for attempt in range(_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except APIError as exc:
+            if attempt == _attempts - 1:
+                raise
+            time.sleep(_backoff_delay(attempt, exc))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+# Trailing weekly buckets counted as "recent" by ``get_repo_commit_activity``.
+_RECENT_ACTIVITY_WEEKS = 4
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Open, closed and recently updated issue counts of one repository.  Unlike
+# the REST ``/issues`` listing, ``issues`` connections exclude pull requests.
+_ISSUE_COUNTS_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime!) {
+  repository(owner: $owner, name: $name) {
+    open: issues(states: OPEN) { totalCount }
+    closed: issues(states: CLOSED) { totalCount }
+    recent: issues(filterBy: {since: $since}) { totalCount }
+  }
+}
+"""
+
+# Well-known dependency manifests probed by ``get_repo_dependency_files``.
+_DEPENDENCY_FILES = (
+    "package.json",  # Node.js
+    "requirements.txt",  # Python
+    "Pipfile",  # Python (pipenv)
+    "pyproject.toml",  # Python (modern)
+    "Gemfile",  # Ruby
+    "pom.xml",  # Java (Maven)
+    "build.gradle",  # Java (Gradle)
+    "composer.json",  # PHP
+    "go.mod",  # Go
+    "Cargo.toml",  # Rust
+)
+
+# One aliased ``object`` lookup per manifest, so a single request returns the
+# text of every file that exists at ``HEAD`` (``null`` for the others).
+_DEPENDENCY_FILES_QUERY = (
+    "query($owner: String!, $name: String!) {\n  repository(owner: $owner, name: $name) {\n"
+    + "".join(
+        f'    f{index}: object(expression: "HEAD:{path}") {{ ... on Blob {{ text }} }}\n'
+        for index, path in enumerate(_DEPENDENCY_FILES)
+    )
+    + "  }\n}\n"
+)
+
+
+# ``page`` parameter of the ``rel="last"`` entry in a pagination Link header.
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _last_page(link: str | None) -> int | None:
+    """Return the last page number announced by a ``Link`` header."""
+    if link and (match := _LAST_PAGE_RE.search(link)):
+        return int(match.group(1))
+    return None
+
+
+def _to_app_repo(repo: dict[str, Any]) -> dict[str, Any]:
+    """Map a REST repository object to the camel-cased keys used by the app.
+
+    Keeping the GraphQL-style names avoids touching dozens of call sites.
+    """
+    return {
+        "name": repo.get("name"),
+        "description": repo.get("description"),
+        "url": repo.get("html_url"),
+        "updatedAt": repo.get("updated_at"),
+        "isArchived": repo.get("archived", False),
+        "stargazerCount": repo.get("stargazers_count", 0),
+        "forkCount": repo.get("forks_count", 0),
+    }
+
+
+# Horizontal whitespace (including ``\r``) at the end of each line.
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
+
+def _clean_readme(text: str, max_bytes: int) -> str:
+    """Truncate README *text* and strip trailing whitespace from each line."""
+    # Truncate to *max_bytes* characters to stay within context limits.
+    readme_content = text[:max_bytes]
+
+    # Collapse excessive whitespace that does not add much signal to the
+    # language model while still preserving separate paragraphs.
+    return _TRAILING_WS_RE.sub("", readme_content)
+
+
+# ``git log`` record layout: full hash, subject, author name, committer
+# timestamp and parent hashes separated by the ASCII unit separator, which
+# cannot occur in them.
+_GIT_LOG_FORMAT = "--pretty=format:%H%x1f%s%x1f%an%x1f%ct%x1f%P"
+_GIT_TIMEOUT = 10
+
+# Parsed ``git log`` record: (hash, subject, author, timestamp, is_merge).
+_LogRecord = tuple[str, str, str, int, bool]
+
+
+def _git_log(repo_path: str, limit: int | None = None) -> list[_LogRecord]:
+    """Return the history of *repo_path*, newest first, from one ``git log``.
+
+    Args:
+        repo_path: Local path to the repository.
+        limit: Maximum number of commits to read (``None`` for all).
+
+    Raises:
+        RuntimeError: If ``git log`` fails (not a repository, no ``HEAD``).
+    """
+    args = ["git", "-C", repo_path, "log", _GIT_LOG_FORMAT, "--no-color"]
+    if limit is not None:
+        args[4:4] = ["-n", str(limit)]
+    result = subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        timeout=_GIT_TIMEOUT,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git log exited {result.returncode}")
+
+    records: list[_LogRecord] = []
+    for line in result.stdout.splitlines():
+        if not line:
+            continue
+        commit_hash, message, author, timestamp, parents = line.split("\x1f")
+        records.append((commit_hash, message, author, int(timestamp), " " in parents))
+    return records
+
+
+def _commit_batch(records: Sequence[_LogRecord]) -> CommitBatch:
+    """Build a ``CommitBatch`` from parsed ``git log`` records."""
+    batch = CommitBatch()
+    for commit_hash, message, author, timestamp, _ in records:
+        batch.hashes.append(commit_hash[:7])
+        batch.messages.append(message)
+        batch.authors.append(author)
+        batch.dates.append(timestamp)
+    return batch
+
+
+def _git_author_counts(repo_path: str) -> list[Contributor]:
+    """Count non-merge commits per author with a names-only ``git log``.
+
+    Asking git for just ``%an`` keeps the output to one name per line, which
+    ``Counter`` tallies directly from ``splitlines()`` without any per-line
+    parsing in Python.
+
+    Raises:
+        RuntimeError: If ``git log`` fails (not a repository, no ``HEAD``).
+    """
+    result = subprocess.run(
+        ["git", "-C", repo_path, "log", "--no-merges", "--pretty=format:%an", "--no-color"],
+        capture_output=True,
+        text=True,
+        timeout=_GIT_TIMEOUT,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git log exited {result.returncode}")
+    counts = Counter(result.stdout.splitlines())
+    counts.pop("", None)
+    return [Contributor(name=name, commits=count) for name, count in counts.most_common()]
+
 
 class GitHubService:
     """Handles interactions with GitHub API and local git repositories.
@@ -51,6 +289,9 @@ class GitHubService:
         github_token: str | None = None,
         rate_limiter: RateLimiter | None = None,
         logger: Logger | None = None,
+        cache_path: str | None = None,
+        cache_ttl: float = DEFAULT_TTL_SECONDS,
+        readme_cache_path: str | None = None,
     ):
         """Initialize the GitHub service.
 
@@ -59,6 +300,13 @@ class GitHubService:
             github_token: Optional GitHub token for API access
             rate_limiter: Optional rate limiter for API calls
             logger: Optional logger for service operations
+            cache_path: Optional shelve file for conditional-request caching;
+                ``None`` disables the cache
+            cache_ttl: Seconds to reuse responses that carry no ETag or
+                Last-Modified validator
+            readme_cache_path: Optional SQLite file from which
+                ``get_repo_readme`` serves READMEs within *cache_ttl*;
+                ``None`` disables it
         """
         self.github_username = github_username
         self.github_token = github_token
@@ -72,7 +320,19 @@ class GitHubService:
         # service.  This drastically reduces the overhead of establishing TLS
         # hand-shakes and negotiating HTTP/2 on every request.
 
+        # Rate limiting lives in the transport adapter, so every request sent
+        # through the session is spaced by the limiter and held back while
+        # GitHub reports the quota as exhausted.
+        self._adapter = RateLimitedAdapter(
+            rate_limiter,
+            logger=logger,
+            # Resolved once; see ``set_debug``.
+            debug=bool(getattr(logger, "debug_enabled", False)),
+            pool_connections=_POOL_MAXSIZE,
+            pool_maxsize=_POOL_MAXSIZE,
+        )
         self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
 
         # Inject the *optional* GitHub token into every request.
         if self.github_token:
@@ -86,14 +346,151 @@ class GitHubService:
             {
                 "Accept": "application/vnd.github+json",
                 "User-Agent": "repo-organizer/1.0 (https://github.com/)",
+                # Ask for compressed bodies explicitly.  urllib3 includes
+                # ``br`` whenever the ``brotli`` package is importable and
+                # decodes the response transparently, including the
+                # streamed README prefix.
+                "Accept-Encoding": ACCEPT_ENCODING,
             },
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(APIError),
-    )
+        self._http_cache = (
+            ConditionalRequestCache(cache_path, ttl=cache_ttl) if cache_path else None
+        )
+        self._readme_cache = (
+            ReadmeCache(readme_cache_path, ttl=cache_ttl) if readme_cache_path else None
+        )
+        # In-process memo for languages / README: repeat lookups of the same
+        # repository within one run are answered without any request.
+        self._memo = TTLCache(maxsize=_MEMO_MAXSIZE, ttl=cache_ttl)
+
+    def clear_cache(self) -> None:
+        """Drop the in-process memo of repositories, languages and READMEs."""
+        self._memo.clear()
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and the on-disk caches."""
+        self._session.close()
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
+        if self._readme_cache is not None:
+            self._readme_cache.close()
+            self._readme_cache = None
+
+    def _remember_repo(self, repo: dict[str, Any]) -> None:
+        """Memoise a raw repository object from the listing by name.
+
+        The listing already carries ``has_issues`` and ``open_issues_count``,
+        which lets ``get_repo_issues_stats`` skip issue requests.
+        """
+        if name := repo.get("name"):
+            self._memo.set(("repo", name), repo)
+
+    def set_debug(self, enabled: bool) -> None:
+        """Update the cached debug flag passed to the rate limiter.
+
+        The flag is read from the logger once at construction; call this if
+        the logger's ``debug_enabled`` setting changes afterwards.
+        """
+        self._adapter.debug = enabled
+
+    def _get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+        max_bytes: int | None = None,
+    ) -> requests.Response | CachedResponse:
+        """Issue a GET, reading at most *max_bytes* of a successful body.
+
+        With *max_bytes* set the body is streamed and the connection closed
+        once enough bytes have arrived, so an oversized payload is neither
+        downloaded in full nor decoded.  Streamed responses with any other
+        status are read and closed before they are returned.
+        """
+        if max_bytes is None:
+            return self._session.get(url, params=params, headers=headers, timeout=timeout)
+
+        response = self._session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
+        if response.status_code != 200:
+            # A 304 or error body is small: load it so the response stays
+            # readable, then hand the connection back to the pool.
+            try:
+                _ = response.content
+            finally:
+                response.close()
+            return response
+
+        content = bytearray()
+        try:
+            for chunk in response.iter_content(chunk_size=max_bytes):
+                content += chunk
+                if len(content) >= max_bytes:
+                    break
+        finally:
+            # Return the connection to the pool without draining the rest.
+            response.close()
+        return CachedResponse(bytes(content[:max_bytes]), headers=dict(response.headers))
+
+    def _json(self, content: bytes, what: str) -> Any:
+        """Decode a JSON response body, mapping malformed JSON to ``APIError``.
+
+        *what* names the payload in the log and error messages.
+        """
+        try:
+            return fast_json.loads(content)
+        except fast_json.JSONDecodeError as exc:
+            if self.logger:
+                self.logger.log(f"Invalid JSON when fetching {what}", "warning")
+            raise APIError(f"Invalid JSON when fetching {what}") from exc
+
+    def _cached_get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+    ) -> requests.Response | CachedResponse:
+        """Issue a GET, revalidating against the on-disk cache when enabled.
+
+        A stored ETag / Last-Modified is sent back as ``If-None-Match`` /
+        ``If-Modified-Since``; on ``304 Not Modified`` the stored body is
+        returned as a ``200`` response.  Successful responses are stored for
+        the next run, and a ``404`` is replayed without a request until the
+        cache TTL expires.  Any other status is passed through untouched.
+        """
+        if self._http_cache is None:
+            return self._get(url, params=params, headers=headers, timeout=timeout)
+
+        key = self._http_cache.key(url, params)
+        entry = self._http_cache.get(key)
+        if entry is not None:
+            if self._http_cache.is_fresh(entry):
+                return self._http_cache.response(entry)
+            headers = {**(headers or {}), **self._http_cache.conditional_headers(entry)}
+
+        response = self._get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            if self.logger:
+                self.logger.log(f"Not modified, using cached body for {key}", "debug")
+            return self._http_cache.response(entry, response.headers)
+        if response.status_code == 200:
+            self._http_cache.put(key, response.content, response.headers)
+        elif response.status_code == 404:
+            self._http_cache.put_not_found(key)
+        return response
+
     def get_repos(self, limit: int = 100) -> list[dict[str, Any]]:
         """Return public (non-fork) repositories for *github_username*.
 
@@ -104,80 +501,110 @@ class GitHubService:
             limit: Maximum number of repositories to fetch (defaults to 100).
 
         Raises:
-            APIError: On network failures or unexpected status codes.
+            APIError: On network failures or unexpected status codes, once
+                all retry attempts are exhausted.
         """
-        collected: list[dict[str, Any]] = []
-        page = 1
-
-        while len(collected) < limit:
-            # ------------------------------------------------------------------
-            # Respect API rate limits *before* performing the request.
-            # ------------------------------------------------------------------
-            if self.rate_limiter:
-                self.rate_limiter.wait(
-                    self.logger,
-                    debug=getattr(self.logger, "debug_enabled", False),
-                )
+        return _with_retry(self._get_repos, limit)
 
-            params: dict[str, Any] = {
-                "per_page": min(100, limit - len(collected)),
-                "page": page,
-                "type": "owner",  # Only repos the user owns (exclude forks)
-                "sort": "updated",
-            }
+    def _fetch_repos_page(
+        self, page: int, per_page: int
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Fetch one raw page of ``/users/{username}/repos``.
 
-            url = f"https://api.github.com/users/{self.github_username}/repos"
+        Returns:
+            The page's repositories and the number of the last page announced
+            by the ``Link`` header (``None`` when the header is absent).
 
-            try:
-                response = self._session.get(url, params=params, timeout=30)
-            except Exception as exc:  # pragma: no cover – network errors
-                if self.logger:
-                    self.logger.log(f"Network error fetching repos: {exc}", "error")
-                raise APIError(str(exc)) from exc
+        Raises:
+            APIError: On network failures, error status codes or invalid JSON.
+        """
+        params: dict[str, Any] = {
+            "per_page": per_page,
+            "page": page,
+            "type": "owner",  # Only repos the user owns (forks included)
+            "sort": "updated",
+        }
 
-            if response.status_code >= 400:
-                if self.logger:
-                    self.logger.log(
-                        f"GitHub API error ({response.status_code}) while fetching repos: {response.text}",
-                        "error",
-                    )
-                    # Count *all* 4xx/5xx responses as retries – they are
-                    # potentially transient (e.g. 502/503) or can be retried
-                    # after back-off (e.g. 403 rate limited without token).
-                    self.logger.update_stats("retries")
-                raise APIError(f"GitHub API responded with {response.status_code}")
+        url = f"https://api.github.com/users/{self.github_username}/repos"
 
-            try:
-                data = response.json()
-            except json.JSONDecodeError as exc:  # pragma: no cover
-                if self.logger:
-                    self.logger.log("Invalid JSON when fetching repos", "error")
-                    self.logger.update_stats("retries")
-                raise APIError("Invalid JSON when fetching repos") from exc
+        try:
+            response = self._cached_get(url, params=params, timeout=30)
+        except requests.RequestException as exc:  # pragma: no cover – network errors
+            if self.logger:
+                self.logger.log(f"Network error fetching repos: {exc}", "error")
+            raise APIError(str(exc)) from exc
 
-            # ``type: owner`` already filters forks, but be defensive in case
-            # that behaviour changes.
-            collected.extend([repo for repo in data if not repo.get("fork", False)])
+        if response.status_code >= 400:
+            if self.logger:
+                self.logger.log(
+                    f"GitHub API error ({response.status_code}) while fetching repos: {response.text}",
+                    "error",
+                )
+                # Count *all* 4xx/5xx responses as retries – they are
+                # potentially transient (e.g. 502/503) or can be retried
+                # after back-off (e.g. 403 rate limited without token).
+                self.logger.update_stats("retries")
+            raise APIError(
+                f"GitHub API responded with {response.status_code}",
+                retry_after=retry_after_seconds(response),
+            )
+
+        data = self._json(response.content, "repos")
+        return data, _last_page(response.headers.get("Link"))
+
+    def _get_repos(self, limit: int) -> list[dict[str, Any]]:
+        """Fetch repositories once, without retrying (see ``get_repos``).
+
+        Page 1 is fetched first.  Its ``Link`` header announces the last page,
+        so the pages needed for *limit* are then requested in parallel instead
+        of one round trip after another.  Forks are only dropped once a page is
+        in, so any shortfall they cause is made up by walking further pages
+        serially until *limit* repositories are collected or the listing ends.
+        """
+        if limit <= 0:
+            return []
 
-            if len(data) < params["per_page"]:  # No more pages
-                break
+        # Every page must use the same ``per_page``: GitHub derives a page's
+        # offset from it, so a smaller final page would repeat repositories.
+        per_page = min(100, limit)
+        data, last_page = self._fetch_repos_page(1, per_page)
+        pages = [data]
+        wanted = -(-limit // per_page)
+        if wanted > 1 and len(data) == per_page and last_page is not None:
+            rest = range(2, min(wanted, last_page) + 1)
+            if rest:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_CONCURRENT_REQUESTS, len(rest))
+                ) as executor:
+                    pages.extend(
+                        executor.map(lambda p: self._fetch_repos_page(p, per_page)[0], rest)
+                    )
 
+        # ``type: owner`` still lists forks the user created; drop them here.
+        # ``islice`` stops at *limit* without building and slicing a copy.
+        collected = list(
+            islice((repo for data in pages for repo in data if not repo.get("fork", False)), limit)
+        )
+        page = len(pages)
+        while (
+            len(collected) < limit
+            and len(pages[-1]) == per_page  # A short page is the last one
+            and (last_page is None or page < last_page)
+        ):
             page += 1
+            data, _ = self._fetch_repos_page(page, per_page)
+            pages.append(data)
+            collected.extend(
+                islice(
+                    (repo for repo in data if not repo.get("fork", False)),
+                    limit - len(collected),
+                )
+            )
 
-        # Map GitHub REST response field names to the camel-cased keys used by
-        # the rest of the application to avoid touching dozens of call sites.
-        def _transform(repo: dict[str, Any]) -> dict[str, Any]:
-            return {
-                "name": repo.get("name"),
-                "description": repo.get("description"),
-                "url": repo.get("html_url"),
-                "updatedAt": repo.get("updated_at"),
-                "isArchived": repo.get("archived", False),
-                "stargazerCount": repo.get("stargazers_count", 0),
-                "forkCount": repo.get("forks_count", 0),
-            }
+        for repo in collected:
+            self._remember_repo(repo)
 
-        results = [_transform(r) for r in collected[:limit]]
+        results = list(map(_to_app_repo, collected))
 
         if self.logger:
             self.logger.log(
@@ -187,11 +614,6 @@ class GitHubService:
 
         return results
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(APIError),
-    )
     def get_repo_languages(self, repo_name: str) -> dict[str, float]:
         """Get the language breakdown for a repository.
 
@@ -201,21 +623,24 @@ class GitHubService:
         Returns:
             Dictionary mapping language names to percentage of code
         """
-        # Apply rate limiting if available
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
+        key = ("languages", repo_name)
+        languages = self._memo.get(key)
+        if languages is None:
+            languages = _with_retry(self._get_repo_languages, repo_name)
+            self._memo.set(key, languages)
+        # Copy so callers cannot mutate the memoised mapping.
+        return dict(languages)
+
+    def _get_repo_languages(self, repo_name: str) -> dict[str, float]:
+        """Fetch the language breakdown once (see ``get_repo_languages``)."""
         if self.logger:
             self.logger.log(f"Fetching languages for {repo_name}…", "debug")
 
         url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/languages"
 
         try:
-            response = self._session.get(url, timeout=15)
-        except Exception as exc:  # pragma: no cover
+            response = self._cached_get(url, timeout=15)
+        except requests.RequestException as exc:  # pragma: no cover
             if self.logger:
                 self.logger.log(
                     f"Network error fetching languages for {repo_name}: {exc}",
@@ -234,54 +659,62 @@ class GitHubService:
                     "warning",
                 )
                 self.logger.update_stats("retries")
-            raise APIError("Error fetching languages")
+            raise APIError("Error fetching languages", retry_after=retry_after_seconds(response))
 
-        try:
-            languages_bytes = response.json()
-        except json.JSONDecodeError as exc:  # pragma: no cover
-            if self.logger:
-                self.logger.log("Invalid JSON response for languages", "warning")
-            raise APIError("Invalid JSON response for languages") from exc
+        body = response.content
+        # Empty and brand-new repositories answer with a bare ``{}``; skip the
+        # JSON parser entirely for those.
+        if len(body) <= 4 and body.strip() in (b"", b"{}"):
+            return {}
+
+        languages_bytes = self._json(body, "languages")
 
         if not languages_bytes:
             return {}
 
-        total_bytes = sum(languages_bytes.values()) or 1  # avoid ZeroDivision
-        return {lang: (cnt / total_bytes) * 100 for lang, cnt in languages_bytes.items()}
+        # One division up front; the comprehension then does a single multiply
+        # per language instead of a divide and a multiply.
+        scale = 100.0 / (sum(languages_bytes.values()) or 1)  # avoid ZeroDivision
+        return {lang: cnt * scale for lang, cnt in languages_bytes.items()}
 
     # ------------------------------------------------------------------
     # README extraction helpers
     # ------------------------------------------------------------------
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(APIError),
-    )
     def get_repo_readme(self, repo_name: str, max_bytes: int = 5000) -> str:
         """Return the raw README contents for *repo_name*.
 
         The GitHub REST API is queried with an ``Accept: application/vnd.github.raw``
         header so the server returns the file content *directly* without the
-        base-64 encoding used by the default representation.  The response is
-        truncated to *max_bytes* characters to ensure we stay within the
-        language-model's context window.
+        base-64 encoding used by the default representation.  The body is
+        streamed and only its first *max_bytes* bytes are read, to stay within
+        the language-model's context window without downloading large READMEs
+        in full.  When a README cache is configured, a README stored within
+        the TTL is returned without any API request; it is the only
+        persistent README store, as the request bypasses the HTTP cache.
 
         Args:
             repo_name: Name of the repository.
             max_bytes: Maximum number of bytes to return (defaults to 5 000).
 
         Returns:
-            A UTF-8 string containing up to *max_bytes* characters of the
+            A UTF-8 string decoded from up to *max_bytes* bytes of the
             repository's README.  Returns an empty string when the README is
             missing or cannot be retrieved.
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
+        key = ("readme", repo_name, max_bytes)
+        readme = self._memo.get(key)
+        if readme is None and self._readme_cache is not None:
+            readme = self._readme_cache.get(repo_name, max_bytes)
+        if readme is None:
+            readme = _with_retry(self._get_repo_readme, repo_name, max_bytes)
+            if self._readme_cache is not None:
+                self._readme_cache.put(repo_name, max_bytes, readme)
+        self._memo.set(key, readme)
+        return readme
+
+    def _get_repo_readme(self, repo_name: str, max_bytes: int) -> str:
+        """Fetch the README once, without retrying (see ``get_repo_readme``)."""
         if self.logger:
             self.logger.log(f"Fetching README for {repo_name}…", "debug")
 
@@ -290,8 +723,8 @@ class GitHubService:
         headers = {"Accept": "application/vnd.github.raw"}
 
         try:
-            response = self._session.get(url, headers=headers, timeout=20)
-        except Exception as exc:  # pragma: no cover
+            response = self._get(url, headers=headers, timeout=20, max_bytes=max_bytes)
+        except requests.RequestException as exc:  # pragma: no cover
             if self.logger:
                 self.logger.log(
                     f"Network error fetching README for {repo_name}: {exc}",
@@ -312,16 +745,44 @@ class GitHubService:
                     "warning",
                 )
                 self.logger.update_stats("retries")
-            raise APIError("Error fetching README")
+            raise APIError("Error fetching README", retry_after=retry_after_seconds(response))
 
-        # Truncate to *max_bytes* characters to stay within context limits.
-        readme_content = (response.text or "")[:max_bytes]
+        return _clean_readme(response.text or "", max_bytes)
 
-        # Collapse excessive whitespace that does not add much signal to the
-        # language model while still preserving separate paragraphs.
-        readme_content = "\n".join(line.rstrip() for line in readme_content.splitlines())
+    # ------------------------------------------------------------------
+    # GraphQL helpers
+    # ------------------------------------------------------------------
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """POST a GraphQL *query* and return its ``data`` payload.
+
+        Raises:
+            APIError: On network failures, HTTP errors, invalid JSON or a
+                response carrying GraphQL ``errors``.
+        """
+        try:
+            response = self._session.post(
+                _GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                timeout=60,
+            )
+        except requests.RequestException as exc:  # pragma: no cover – network errors
+            raise APIError(str(exc)) from exc
+
+        if response.status_code >= 400:
+            if self.logger:
+                self.logger.update_stats("retries")
+            raise APIError(
+                f"GitHub GraphQL API responded with {response.status_code}",
+                retry_after=retry_after_seconds(response),
+            )
 
-        return readme_content
+        payload = self._json(response.content, "GraphQL data")
+
+        if payload.get("errors") or not payload.get("data"):
+            messages = "; ".join(e.get("message", "") for e in payload.get("errors") or [])
+            raise APIError(f"GitHub GraphQL API error: {messages or 'no data'}")
+        return payload["data"]
 
     def get_repo_commits(self, repo_path: str, limit: int = 10) -> list[Commit]:
         """Get recent commits for a repository.
@@ -333,33 +794,30 @@ class GitHubService:
         Returns:
             List of Commit objects
         """
-        try:
-            if not os.path.isdir(repo_path):
-                return []
+        return list(self.get_repo_commits_batch(repo_path, limit).iter_commits())
 
-            repo = git.Repo(repo_path)
-            commits = []
-
-            for commit in list(repo.iter_commits("HEAD", max_count=limit)):
-                commits.append(
-                    Commit(
-                        hash=commit.hexsha[:7],
-                        message=commit.message.split("\n")[0],
-                        author=commit.author.name,
-                        date=datetime.datetime.fromtimestamp(
-                            commit.committed_date,
-                        ).strftime("%Y-%m-%d"),
-                    ),
-                )
+    def get_repo_commits_batch(self, repo_path: str, limit: int = 10) -> CommitBatch:
+        """Get recent commits for a repository in column-oriented form.
+
+        Args:
+            repo_path: Local path to the repository
+            limit: Maximum number of commits to retrieve
 
-            return commits
-        except Exception as e:
+        Returns:
+            CommitBatch holding parallel lists of hashes, messages, authors
+            and unix commit timestamps (empty on error)
+        """
+        try:
+            if not os.path.isdir(repo_path):
+                return CommitBatch()
+            return _commit_batch(_git_log(repo_path, limit))
+        except (OSError, RuntimeError, subprocess.SubprocessError) as e:
             if self.logger:
                 self.logger.log(
                     f"Error getting commits for {repo_path}: {e!s}",
                     "warning",
                 )
-            return []
+            return CommitBatch()
 
     def get_repo_contributors(self, repo_path: str) -> list[Contributor]:
         """Get contributors for a repository.
@@ -368,37 +826,13 @@ class GitHubService:
             repo_path: Local path to the repository
 
         Returns:
-            List of Contributor objects
+            List of Contributor objects, most non-merge commits first
         """
         try:
             if not os.path.isdir(repo_path):
                 return []
-
-            result = subprocess.run(
-                ["git", "shortlog", "-sn", "--no-merges"],
-                capture_output=True,
-                text=True,
-                cwd=repo_path,
-                check=False,
-            )
-
-            contributors = []
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                for line in lines:
-                    if line.strip():
-                        parts = line.strip().split("\t")
-                        if len(parts) == 2:
-                            count, name = parts
-                            contributors.append(
-                                Contributor(
-                                    name=name.strip(),
-                                    commits=int(count.strip()),
-                                ),
-                            )
-
-            return contributors
-        except Exception as e:
+            return _git_author_counts(repo_path)
+        except (OSError, RuntimeError, subprocess.SubprocessError) as e:
             if self.logger:
                 self.logger.log(
                     f"Error getting contributors for {repo_path}: {e!s}",
@@ -408,123 +842,150 @@ class GitHubService:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_tenacity_wait,
         retry=retry_if_exception_type(APIError),
     )
     def get_repo_issues_stats(self, repo_name: str) -> dict[str, Any]:
         """Get issue statistics for a repository.
 
+        With a token the three figures come from one GraphQL query of
+        ``totalCount`` values, which excludes pull requests.  Without one, or
+        if that query fails, they are read from the ``Link`` header of
+        ``per_page=1`` REST ``/issues`` listings, whose counts include pull
+        requests.  A repository already returned by ``get_repos`` with issues
+        disabled needs no request at all.
+
         Args:
             repo_name: Name of the repository
 
         Returns:
-            Dictionary with issue statistics (open_count, closed_count, recent_activity)
+            Dictionary with issue statistics (open_count, closed_count, recent_activity);
+            all zero when GitHub rejects the request (e.g. the repository is gone)
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
         if self.logger:
             self.logger.log(f"Fetching issues for {repo_name}…", "debug")
 
-        # Get open issues count
-        open_url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/issues"
-        params = {"state": "open", "per_page": 1}
+        no_issues = {"open_count": 0, "closed_count": 0, "recent_activity": False}
+        # A repository seen in ``get_repos`` exists; its listing entry
+        # answers the cheap cases without any request.
+        listed = self._memo.get(("repo", repo_name))
+        if listed is not None and not listed.get("has_issues", True):
+            return no_issues
 
+        since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=30)
         try:
-            open_response = self._session.get(open_url, params=params, timeout=15)
+            if self.github_token:
+                try:
+                    return self._get_issue_counts_graphql(repo_name, since)
+                except APIError as exc:
+                    if self.logger:
+                        self.logger.log(
+                            f"GraphQL issue counts failed for {repo_name} ({exc}); "
+                            "falling back to REST",
+                            "debug",
+                        )
+            return self._get_issue_counts_rest(repo_name, since, listed) or no_issues
+        except requests.RequestException as e:
+            if self.logger:
+                self.logger.log(f"Error fetching issues stats: {e!s}", "warning")
+                self.logger.update_stats("retries")
+            raise APIError(f"Error fetching issues stats: {e!s}") from e
 
-            if open_response.status_code == 404:
-                return {"open_count": 0, "closed_count": 0, "recent_activity": False}
+    def _get_issue_counts_graphql(
+        self,
+        repo_name: str,
+        since: datetime.datetime,
+    ) -> dict[str, Any]:
+        """Read the ``get_repo_issues_stats`` figures with ``_ISSUE_COUNTS_QUERY``.
 
-            if open_response.status_code >= 400:
-                if self.logger:
-                    self.logger.log(
-                        f"Error fetching open issues: {open_response.status_code}",
-                        "warning",
-                    )
-                return {"open_count": 0, "closed_count": 0, "recent_activity": False}
+        Raises:
+            APIError: If the GraphQL request fails (see ``_graphql``) or the
+                repository is not returned.
+        """
+        data = self._graphql(
+            _ISSUE_COUNTS_QUERY,
+            {
+                "owner": self.github_username,
+                "name": repo_name,
+                "since": since.isoformat(timespec="seconds"),
+            },
+        )
+        repository = data.get("repository")
+        if not repository:
+            raise APIError(f"Repository {repo_name} not found")
+        return {
+            "open_count": repository["open"]["totalCount"],
+            "closed_count": repository["closed"]["totalCount"],
+            "recent_activity": repository["recent"]["totalCount"] > 0,
+        }
+
+    def _get_issue_counts_rest(
+        self,
+        repo_name: str,
+        since: datetime.datetime,
+        listed: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        """Read the ``get_repo_issues_stats`` figures from ``/issues`` listings.
 
-            # Get total from Link header or fallback to counting
-            total_open = 0
-            if "Link" in open_response.headers:
-                link_header = open_response.headers["Link"]
-                last_match = re.search(r'page=(\d+)>; rel="last"', link_header)
-                if last_match:
-                    total_open = int(last_match.group(1))
+        Returns:
+            The statistics, or ``None`` when GitHub rejects a request (``4xx``).
 
-            if total_open == 0:
-                try:
-                    # Just count what we got
-                    total_open = len(open_response.json())
-                except Exception:  # Handle any JSON decode or other errors
-                    total_open = 0
-
-            # Check for recent activity (in the last 30 days)
-            recent_activity = False
-            if total_open > 0:
-                try:
-                    recent_params = {
-                        "state": "all",
-                        "per_page": 5,
-                        "sort": "updated",
-                        "direction": "desc",
-                    }
-                    recent_response = self._session.get(
-                        open_url,
-                        params=recent_params,
-                        timeout=15,
-                    )
-                    if recent_response.status_code == 200:
-                        recent_issues = recent_response.json()
-                        if recent_issues:
-                            now = datetime.datetime.now()
-                            for issue in recent_issues:
-                                updated_at = issue.get("updated_at")
-                                if updated_at:
-                                    updated_date = datetime.datetime.fromisoformat(
-                                        updated_at.rstrip("Z"),
-                                    )
-                                    if (now - updated_date).days <= 30:
-                                        recent_activity = True
-                                        break
-                except Exception as e:
-                    if self.logger:
-                        self.logger.log(f"Error checking recent activity: {e}", "debug")
+        Raises:
+            APIError: On a server error status.
+        """
+        url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/issues"
+        if listed is not None and listed.get("open_issues_count") == 0:
+            # The count includes pull requests, so zero means no open issues.
+            open_count = 0
+        else:
+            open_count = self._count_issues(url, {"state": "open"})
+        if open_count is None:
+            return None
+        closed_count = self._count_issues(url, {"state": "closed"})
+        recent_count = self._count_issues(
+            url,
+            {"state": "all", "since": since.isoformat(timespec="seconds")},
+        )
+        if closed_count is None or recent_count is None:
+            return None
+        return {
+            "open_count": open_count,
+            "closed_count": closed_count,
+            "recent_activity": recent_count > 0,
+        }
 
-            # Get closed issues count - approximate using repo stats
-            closed_count = 0
-            stats_url = f"https://api.github.com/repos/{self.github_username}/{repo_name}"
+    def _count_issues(self, url: str, params: dict[str, Any]) -> int | None:
+        """Return how many items the ``/issues`` listing at *url* has for *params*.
 
-            try:
-                stats_response = self._session.get(stats_url, timeout=15)
-                if stats_response.status_code == 200:
-                    repo_data = stats_response.json()
-                    total_issues = repo_data.get("open_issues_count", 0)
-                    # Total issues count in GitHub API includes PRs, so it's an approximation
-                    # but we know open_issues_count includes PRs, so closed issues estimate is rough
-                    if total_issues >= total_open:
-                        closed_count = max(0, total_issues - total_open)
-            except Exception as e:
-                if self.logger:
-                    self.logger.log(f"Error fetching repo stats: {e}", "debug")
+        With ``per_page=1`` the ``rel="last"`` page number is the item count.
 
-            return {
-                "open_count": total_open,
-                "closed_count": closed_count,
-                "recent_activity": recent_activity,
-            }
-        except Exception as e:
+        Returns:
+            The count, or ``None`` when GitHub rejects the request (``4xx``).
+
+        Raises:
+            APIError: On a server error status.
+        """
+        response = self._cached_get(url, params={**params, "per_page": 1}, timeout=15)
+        if response.status_code >= 500:
+            raise APIError(
+                f"GitHub API responded with {response.status_code}",
+                retry_after=retry_after_seconds(response),
+            )
+        if response.status_code >= 400:
             if self.logger:
-                self.logger.log(f"Error fetching issues stats: {e!s}", "warning")
-                self.logger.update_stats("retries")
-            raise APIError(f"Error fetching issues stats: {e!s}") from e
+                self.logger.log(
+                    f"Error fetching issues ({response.status_code}) from {url}",
+                    "warning",
+                )
+            return None
+        last_page = _last_page(response.headers.get("Link"))
+        if last_page is not None:
+            return last_page
+        return len(self._json(response.content, "issues"))
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_tenacity_wait,
         retry=retry_if_exception_type(APIError),
     )
     def get_repo_commit_activity(self, repo_name: str) -> dict[str, Any]:
@@ -536,12 +997,6 @@ class GitHubService:
         Returns:
             Dictionary with commit activity statistics
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
         if self.logger:
             self.logger.log(f"Fetching commit activity for {repo_name}…", "debug")
 
@@ -550,7 +1005,7 @@ class GitHubService:
         )
 
         try:
-            response = self._session.get(url, timeout=20)
+            response = self._cached_get(url, timeout=20)
 
             if response.status_code == 202:
                 # GitHub is computing the stats asynchronously
@@ -574,34 +1029,35 @@ class GitHubService:
                 return {"recent_commits": 0, "active_weeks": 0, "total_commits": 0}
 
             try:
-                activity_data = response.json()
-            except json.JSONDecodeError:
+                activity_data = fast_json.loads(response.content)
+            except fast_json.JSONDecodeError:
                 return {"recent_commits": 0, "active_weeks": 0, "total_commits": 0}
 
-            # Process the weekly commit data (last 52 weeks)
+            # Process the weekly commit data (last 52 weeks).  GitHub lists
+            # the weeks oldest first, so "recent" is the trailing buckets by
+            # position: a cutoff on the week-start timestamps would take in
+            # an extra bucket whenever the current week has just begun.
             total_commits = 0
             active_weeks = 0
             recent_commits = 0  # Last 4 weeks
 
             if isinstance(activity_data, list):
-                weeks_to_consider = min(len(activity_data), 52)
-                for i in range(weeks_to_consider):
-                    week_data = activity_data[i]
+                weeks = activity_data[-52:]
+                for week_data in weeks:
                     week_commits = week_data.get("total", 0)
-                    total_commits += week_commits
                     if week_commits > 0:
+                        total_commits += week_commits
                         active_weeks += 1
-
-                    # Count recent commits (last 4 weeks)
-                    if i < 4:  # Most recent 4 weeks
-                        recent_commits += week_commits
+                recent_commits = sum(
+                    week_data.get("total", 0) for week_data in weeks[-_RECENT_ACTIVITY_WEEKS:]
+                )
 
             return {
                 "recent_commits": recent_commits,
                 "active_weeks": active_weeks,
                 "total_commits": total_commits,
             }
-        except Exception as e:
+        except (APIError, requests.RequestException) as e:
             if self.logger:
                 self.logger.log(f"Error fetching commit activity: {e!s}", "warning")
                 self.logger.update_stats("retries")
@@ -609,7 +1065,7 @@ class GitHubService:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_tenacity_wait,
         retry=retry_if_exception_type(APIError),
     )
     def get_repo_contributors_stats(self, repo_name: str) -> dict[str, Any]:
@@ -621,19 +1077,13 @@ class GitHubService:
         Returns:
             Dictionary with contributor statistics
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
         if self.logger:
             self.logger.log(f"Fetching contributor stats for {repo_name}…", "debug")
 
         url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/stats/contributors"
 
         try:
-            response = self._session.get(url, timeout=20)
+            response = self._cached_get(url, timeout=20)
 
             if response.status_code == 202:
                 # GitHub is computing the stats asynchronously
@@ -657,8 +1107,8 @@ class GitHubService:
                 return {"contributor_count": 0, "active_contributors": 0}
 
             try:
-                contributors_data = response.json()
-            except json.JSONDecodeError:
+                contributors_data = fast_json.loads(response.content)
+            except fast_json.JSONDecodeError:
                 return {"contributor_count": 0, "active_contributors": 0}
 
             # Process the contributor data
@@ -678,7 +1128,7 @@ class GitHubService:
                 "contributor_count": contributor_count,
                 "active_contributors": active_contributors,
             }
-        except Exception as e:
+        except (APIError, requests.RequestException) as e:
             if self.logger:
                 self.logger.log(
                     f"Error fetching contributor stats: {e!s}",
@@ -689,7 +1139,7 @@ class GitHubService:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_tenacity_wait,
         retry=retry_if_exception_type(APIError),
     )
     def get_repo_dependency_files(self, repo_name: str) -> dict[str, Any]:
@@ -701,57 +1151,24 @@ class GitHubService:
         Returns:
             Dictionary with dependency file contents
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait(
-                self.logger,
-                debug=getattr(self.logger, "debug_enabled", False),
-            )
-
         if self.logger:
             self.logger.log(f"Fetching dependency files for {repo_name}…", "debug")
 
-        # Common dependency file paths
-        dep_files = [
-            "package.json",  # Node.js
-            "requirements.txt",  # Python
-            "Pipfile",  # Python (pipenv)
-            "pyproject.toml",  # Python (modern)
-            "Gemfile",  # Ruby
-            "pom.xml",  # Java (Maven)
-            "build.gradle",  # Java (Gradle)
-            "composer.json",  # PHP
-            "go.mod",  # Go
-            "Cargo.toml",  # Rust
-        ]
-
-        results = {}
-        found_any = False
-
-        for file_path in dep_files:
-            url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/contents/{file_path}"
-
+        results: dict[str, Any]
+        if self.github_token:
             try:
-                response = self._session.get(url, timeout=15)
-
-                if response.status_code == 200:
-                    try:
-                        content_data = response.json()
-                        if content_data.get("type") == "file":
-                            # File exists, get content
-                            content = base64.b64decode(
-                                content_data.get("content", ""),
-                            ).decode("utf-8")
-                            results[file_path] = content
-                            found_any = True
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.log(
-                                f"Error parsing {file_path} content: {e}",
-                                "debug",
-                            )
-            except Exception as e:
+                results = self._get_dependency_files_graphql(repo_name)
+            except APIError as exc:
                 if self.logger:
-                    self.logger.log(f"Error fetching {file_path}: {e!s}", "debug")
+                    self.logger.log(
+                        f"GraphQL dependency lookup failed for {repo_name} ({exc}); "
+                        "falling back to REST",
+                        "debug",
+                    )
+                results = self._get_dependency_files_rest(repo_name)
+        else:
+            results = self._get_dependency_files_rest(repo_name)
+        found_any = bool(results)
 
         # Add a summary if any files were found
         if found_any:
@@ -759,21 +1176,21 @@ class GitHubService:
             for file, content in results.items():
                 if file == "package.json":
                     try:
-                        data = json.loads(content)
+                        data = fast_json.loads(content)
                         deps = list(data.get("dependencies", {}).keys())
                         dev_deps = list(data.get("devDependencies", {}).keys())
                         summary.append(
                             f"Node.js project with {len(deps)} dependencies and {len(dev_deps)} dev dependencies",
                         )
-                    except Exception:
+                    except (fast_json.JSONDecodeError, AttributeError):
                         summary.append("Node.js project (could not parse package.json)")
                 elif file == "requirements.txt":
-                    lines = [
-                        line
+                    count = sum(
+                        1
                         for line in content.splitlines()
                         if line.strip() and not line.startswith("#")
-                    ]
-                    summary.append(f"Python project with {len(lines)} dependencies")
+                    )
+                    summary.append(f"Python project with {count} dependencies")
                 elif file == "pyproject.toml":
                     summary.append(
                         "Python project using modern tooling (pyproject.toml)",
@@ -788,3 +1205,50 @@ class GitHubService:
             results["summary"] = ", ".join(summary)
 
         return results
+
+    def _get_dependency_files_graphql(self, repo_name: str) -> dict[str, str]:
+        """Read all ``_DEPENDENCY_FILES`` at ``HEAD`` with one GraphQL query.
+
+        Raises:
+            APIError: If the GraphQL request fails (see ``_graphql``).
+        """
+        data = self._graphql(
+            _DEPENDENCY_FILES_QUERY,
+            {"owner": self.github_username, "name": repo_name},
+        )
+        repository = data.get("repository") or {}
+        results: dict[str, str] = {}
+        for index, file_path in enumerate(_DEPENDENCY_FILES):
+            blob = repository.get(f"f{index}")
+            if blob and blob.get("text") is not None:
+                results[file_path] = blob["text"]
+        return results
+
+    def _get_dependency_files_rest(self, repo_name: str) -> dict[str, str]:
+        """Probe each of ``_DEPENDENCY_FILES`` through the contents endpoint.
+
+        The raw media type returns the file bytes themselves rather than a
+        JSON envelope with base64 content, a third smaller on the wire and
+        with nothing to unwrap.  Missing files answer ``404``.
+        """
+        headers = {"Accept": "application/vnd.github.raw"}
+        results: dict[str, str] = {}
+        for file_path in _DEPENDENCY_FILES:
+            url = f"https://api.github.com/repos/{self.github_username}/{repo_name}/contents/{file_path}"
+
+            try:
+                response = self._cached_get(url, headers=headers, timeout=15)
+
+                if response.status_code == 200:
+                    try:
+                        results[file_path] = response.content.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        if self.logger:
+                            self.logger.log(
+                                f"Error parsing {file_path} content: {e}",
+                                "debug",
+                            )
+            except requests.RequestException as e:
+                if self.logger:
+                    self.logger.log(f"Error fetching {file_path}: {e!s}", "debug")
+        return results
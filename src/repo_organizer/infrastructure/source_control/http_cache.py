@@ -0,0 +1,141 @@
+"""On-disk cache for conditional GitHub REST requests.
+
+GitHub returns ``ETag`` and ``Last-Modified`` validators on most REST
+responses.  Replaying them via ``If-None-Match`` / ``If-Modified-Since`` lets
+the server answer ``304 Not Modified`` with an empty body, and authenticated
+``304`` responses do not count against the primary rate limit.  Between runs of
+the organizer most repositories are unchanged, so the bulk of the metadata
+requests collapse to cheap revalidations.
+
+Responses that carry no validator are kept for a short TTL instead and served
+without contacting the API at all until they expire.  ``404 Not Found`` answers
+are remembered the same way, so probes for files a repository does not have
+(dependency manifests) are not repeated within the TTL.
+"""
+
+from __future__ import annotations
+
+import os
+import shelve
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Lifetime of cached bodies that came without an ETag / Last-Modified header.
+DEFAULT_TTL_SECONDS = 3600.0
+
+# Response headers callers read besides the body (pagination ``Link`` headers
+# carry the issue counts), kept with each entry.
+_STORED_HEADERS = ("Link",)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Minimal stand-in for ``requests.Response`` built from a cached body."""
+
+    content: bytes
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        """Return the body decoded as UTF-8.
+
+        Undecodable bytes are dropped rather than replaced: a body truncated to
+        a byte limit may end part-way through a multi-byte character.
+        """
+        return self.content.decode("utf-8", errors="ignore")
+
+
+class ConditionalRequestCache:
+    """Thread-safe ``shelve`` store of response bodies keyed by request URL.
+
+    Each entry holds the raw body together with the validators returned by
+    GitHub and the time it was stored.  ``shelve`` is not safe for concurrent
+    access, so every operation is serialised through a single lock.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL_SECONDS):
+        """Open (or create) the cache file.
+
+        Args:
+            path: Filename of the shelve database; parent directories are
+                created as needed.
+            ttl: Seconds for which a body without validators is served from
+                the cache without revalidation.
+        """
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._shelf = shelve.open(path)  # noqa: SIM115 – closed via close()
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        """Build the cache key for *url* with optional query *params*."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored entry for *key*, or ``None``."""
+        with self._lock:
+            return self._shelf.get(key)
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Return ``True`` if *entry* has no validators and is within its TTL."""
+        if entry.get("etag") or entry.get("last_modified"):
+            return False
+        return time.time() - entry["stored_at"] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, Any]) -> dict[str, str]:
+        """Return the revalidation headers for a stored *entry*."""
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def response(entry: dict[str, Any], headers: Mapping[str, str] | None = None) -> CachedResponse:
+        """Build a response (``200``, or ``404`` for a miss) from a stored *entry*.
+
+        Args:
+            entry: Entry returned by ``get``.
+            headers: Headers of a ``304`` revalidation, overriding stored ones.
+        """
+        return CachedResponse(
+            entry["content"],
+            status_code=entry.get("status_code", 200),
+            headers={**entry.get("headers", {}), **(headers or {})},
+        )
+
+    def put(self, key: str, content: bytes, headers: Mapping[str, str]) -> None:
+        """Store a ``200`` response body along with its validators."""
+        entry = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "headers": {name: headers[name] for name in _STORED_HEADERS if name in headers},
+            "content": content,
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            self._shelf[key] = entry
+
+    def put_not_found(self, key: str) -> None:
+        """Remember that *key* answered ``404`` until the TTL expires."""
+        entry = {"status_code": 404, "content": b"", "stored_at": time.time()}
+        with self._lock:
+            self._shelf[key] = entry
+
+    def close(self) -> None:
+        """Flush and close the underlying shelve database."""
+        with self._lock:
+            self._shelf.close()
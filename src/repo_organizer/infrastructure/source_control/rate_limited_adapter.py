@@ -0,0 +1,91 @@
+"""Transport adapter that rate-limits every request sent through a session.
+
+Mounting the adapter on the service's ``requests.Session`` applies the rate
+limiter to each outbound request, including the parallel listing pages and
+the GraphQL / contents calls, so no method has to remember to call
+``RateLimiter.wait`` itself.  The adapter also honours GitHub's own throttling
+signals: once a response reports an exhausted quota (``X-RateLimit-Remaining:
+0``) or carries ``Retry-After``, every request through the adapter is held back
+until that moment instead of being sent only to be rejected again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import requests
+
+    from repo_organizer.utils.logger import Logger
+    from repo_organizer.utils.rate_limiter import RateLimiter
+
+# Longest pause taken on a server-provided delay; a larger ``Retry-After`` or a
+# reset time further away is treated as this many seconds.
+RETRY_AFTER_CAP = 300.0
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the delay GitHub asked for on a throttled *response*, if any."""
+    headers = response.headers
+    try:
+        if (value := headers.get("Retry-After")) is not None:
+            delay = float(value)
+        elif headers.get("X-RateLimit-Remaining") == "0" and (
+            reset := headers.get("X-RateLimit-Reset")
+        ):
+            delay = float(reset) - time.time()
+        else:
+            return None
+    except ValueError:  # HTTP-date form of Retry-After – fall back to back-off
+        return None
+    return min(RETRY_AFTER_CAP, max(0.0, delay))
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that spaces requests and pauses on GitHub throttling."""
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        logger: Logger | None = None,
+        debug: bool = False,
+        **kwargs: Any,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            rate_limiter: Optional limiter applied to every request
+            logger: Optional logger passed to the limiter
+            debug: Whether the limiter logs individual waits
+            **kwargs: Forwarded to ``HTTPAdapter`` (pool sizes, retries)
+        """
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+        self.logger = logger
+        self.debug = debug
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """Wait for the limiter (and any server-imposed pause), then send."""
+        with self._lock:
+            pause = self._resume_at - time.time()
+        if pause > 0:
+            if self.logger:
+                self.logger.log(f"GitHub rate limit: pausing {pause:.1f}s", level="warning")
+            time.sleep(pause)
+
+        if self.rate_limiter:
+            self.rate_limiter.wait(self.logger, debug=self.debug)
+
+        response = super().send(request, **kwargs)
+
+        if (delay := retry_after_seconds(response)) is not None:
+            with self._lock:
+                self._resume_at = max(self._resume_at, time.time() + delay)
+        return response
@@ -0,0 +1,119 @@
+"""On-disk cache of cleaned README text for repeated analysis runs.
+
+README text is stored once per distinct content hash, so template clones and
+forks that ship identical READMEs share a single row.  Each repository maps to
+the hash of the README last seen for it; within the TTL a lookup is answered
+from disk without touching the GitHub API.  The hash is exposed so downstream
+consumers can key their own caches on unchanged content.  Expired entries, the
+oldest entries beyond a size limit and text no entry refers to any more are
+evicted whenever the database is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from repo_organizer.infrastructure.source_control.http_cache import DEFAULT_TTL_SECONDS
+
+# Repository READMEs kept; the least recently stored beyond this are evicted.
+DEFAULT_MAX_ENTRIES = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readme_blobs (
+    sha TEXT PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS readme_refs (
+    repo TEXT NOT NULL,
+    max_bytes INTEGER NOT NULL,
+    sha TEXT NOT NULL REFERENCES readme_blobs(sha),
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (repo, max_bytes)
+);
+"""
+
+
+def readme_digest(text: str) -> str:
+    """Return the content hash used to deduplicate README *text*."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ReadmeCache:
+    """Thread-safe SQLite store of README text keyed by repository."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache database and evict old entries.
+
+        Args:
+            path: SQLite database filename; parent directories are created as
+                needed.
+            ttl: Seconds for which a stored README is returned without
+                refetching it, and kept at all.
+            max_entries: Most (repository, size limit) entries kept.
+        """
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired and surplus entries, then README text left unused."""
+        self._conn.execute(
+            "DELETE FROM readme_refs WHERE stored_at <= ?",
+            (time.time() - self.ttl,),
+        )
+        self._conn.execute(
+            "DELETE FROM readme_refs WHERE rowid NOT IN"
+            " (SELECT rowid FROM readme_refs ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._conn.execute(
+            "DELETE FROM readme_blobs WHERE sha NOT IN (SELECT sha FROM readme_refs)",
+        )
+
+    def get(self, repo: str, max_bytes: int) -> str | None:
+        """Return the cached README for *repo*, or ``None`` if absent or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.text, r.stored_at FROM readme_refs r"
+                " JOIN readme_blobs b ON b.sha = r.sha"
+                " WHERE r.repo = ? AND r.max_bytes = ?",
+                (repo, max_bytes),
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return row[0]
+
+    def put(self, repo: str, max_bytes: int, text: str) -> str:
+        """Store README *text* for *repo* and return its content hash."""
+        sha = readme_digest(text)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO readme_blobs (sha, text) VALUES (?, ?)",
+                (sha, text),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO readme_refs (repo, max_bytes, sha, stored_at)"
+                " VALUES (?, ?, ?, ?)",
+                (repo, max_bytes, sha, time.time()),
+            )
+        return sha
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
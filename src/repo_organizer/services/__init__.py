@@ -3,22 +3,49 @@
 This package contains service implementations that follow the
 Hexagonal Architecture pattern, separating domain logic from external
 dependencies.
+
+Exports are resolved lazily (PEP 562) so that importing one service does not
+pull in the others – in particular ``LLMService``, which loads the LangChain and
+Anthropic SDKs, is only imported when it is actually requested.
 """
 
-from repo_organizer.infrastructure.analysis.llm_service import LLMService
-from repo_organizer.infrastructure.source_control.github_service import GitHubService
-from repo_organizer.services.progress_reporter import ProgressReporter
-from repo_organizer.services.repository_analyzer_service import RepositoryAnalyzerService
-from repo_organizer.services.service_interfaces import (
-    ProgressReporterPort,
-    RepositoryAnalyzerPort,
-)
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, str] = {
+    "GitHubService": "repo_organizer.infrastructure.source_control.github_service",
+    "LLMService": "repo_organizer.infrastructure.analysis.llm_service",
+    "ProgressReporter": "repo_organizer.services.progress_reporter",
+    "RepositoryAnalyzerService": "repo_organizer.domain.analysis.repository_analyzer_service",
+    "GitHubServiceProtocol": "repo_organizer.services.service_interfaces",
+    "LLMServiceProtocol": "repo_organizer.services.service_interfaces",
+    "RepositoryAnalyzerServiceProtocol": "repo_organizer.services.service_interfaces",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested export on first access and cache it."""
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "GitHubService",
+    "GitHubServiceProtocol",
     "LLMService",
+    "LLMServiceProtocol",
     "ProgressReporter",
-    "ProgressReporterPort",
-    "RepositoryAnalyzerPort",
     "RepositoryAnalyzerService",
+    "RepositoryAnalyzerServiceProtocol",
 ]
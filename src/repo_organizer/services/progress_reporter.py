@@ -4,10 +4,38 @@ This module implements the Observer pattern to report progress of
 long-running repository analysis operations.
 """
 
+import queue
+import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol
 
+# Minimum seconds between observer notifications.  Fine-grained updates in
+# between are coalesced; the final one of a run is always delivered.
+MIN_NOTIFY_INTERVAL = 0.05
+
+# Status messages come from a small vocabulary, so equal ones share a single
+# string object.  The pool is bounded; it is simply reset when it fills up.
+_STATUS_POOL: dict[str, str] = {}
+_STATUS_POOL_MAX = 512
+_STATUS_POOL_MAX_LEN = 256
+
+# Line breaks would disrupt single-line console output
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# Tells the background dispatch thread to exit
+_STOP = object()
+
+
+def _pooled_status(status: str) -> str:
+    """Return the pooled copy of *status*, adding it if it is short enough."""
+    if len(status) >= _STATUS_POOL_MAX_LEN:
+        return status
+    if len(_STATUS_POOL) >= _STATUS_POOL_MAX and status not in _STATUS_POOL:
+        _STATUS_POOL.clear()
+    return _STATUS_POOL.setdefault(status, status)
+
 
 class ProgressObserver(Protocol):
     """Protocol defining the interface for progress observers."""
@@ -23,9 +51,9 @@ class ProgressObserver(Protocol):
         ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProgressUpdate:
-    """Data class representing a progress update."""
+    """Immutable snapshot of a progress update."""
 
     current: int
     total: int
@@ -39,13 +67,37 @@ class ProgressReporter:
     subscribe to progress updates from the repository analysis process.
     """
 
-    def __init__(self):
-        """Initialize the progress reporter."""
+    def __init__(self, min_interval: float = MIN_NOTIFY_INTERVAL, background: bool = False):
+        """Initialize the progress reporter.
+
+        Args:
+            min_interval: Minimum seconds between notifications; updates in
+                between are coalesced until the next one or ``flush``
+            background: Deliver notifications from a daemon thread so slow
+                observers never block the caller; an update not yet picked
+                up is replaced by the next one.  Call ``close`` when done.
+        """
         self._observers: list[ProgressObserver] = []
         self._progress_callback: Callable[[int, int, str | None], None] | None = None
         self._current = 0
         self._total = 0
         self._status = None
+        self._min_interval = min_interval
+        self._last_notify = float("-inf")
+        self._pending = False
+        self._last_notified: tuple[int, int, str | None] | None = None
+
+        self._queue: queue.Queue | None = None
+        self._queue_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue(maxsize=1)
+            self._worker = threading.Thread(
+                target=self._drain,
+                name="progress-dispatch",
+                daemon=True,
+            )
+            self._worker.start()
 
     def register_observer(self, observer: ProgressObserver) -> None:
         """Register a new observer.
@@ -84,26 +136,91 @@ class ProgressReporter:
     ) -> None:
         """Update the progress and notify all observers.
 
+        Observers are notified at most once per ``min_interval``, except that
+        completion (``current >= total``) and status changes always go out.
+        An update identical to the last one delivered is dropped.
+
         Args:
             current: Current progress value
             total: Total number of items to process
             status: Optional status message
         """
+        previous_status = self._status
         self._current = current
         self._total = total
-        # Ensure status doesn't contain newlines that could disrupt console output
         if status:
-            self._status = status.replace("\n", " ")
+            # Only copy the string when it actually contains a line break
+            if "\n" in status or "\r" in status:
+                status = status.translate(_NL_TABLE)
+            status = _pooled_status(status)
+        self._status = status
+
+        # Nothing to send if observers already have exactly this state
+        if (current, total, self._status) == self._last_notified:
+            self._pending = False
+            return
+
+        now = time.monotonic()
+        if (
+            now - self._last_notify >= self._min_interval
+            or current >= total
+            or (self._status is not None and self._status != previous_status)
+        ):
+            self._notify(now)
         else:
-            self._status = status
+            self._pending = True
 
-        # Notify all observers
-        for observer in self._observers:
-            observer.update(current, total, self._status)
+    def flush(self) -> None:
+        """Deliver the latest coalesced update, if one is still pending."""
+        if self._pending:
+            self._notify(time.monotonic())
+
+    def close(self) -> None:
+        """Deliver the last queued update and stop the background thread.
+
+        Does nothing for a reporter that notifies synchronously.
+        """
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        with self._queue_lock:
+            self._queue.put(_STOP)
+        worker.join()
+
+    def _notify(self, now: float) -> None:
+        """Send the current progress to all observers and the callback."""
+        self._last_notify = now
+        self._pending = False
+        self._last_notified = (self._current, self._total, self._status)
+
+        if self._worker is None:
+            self._dispatch(*self._last_notified)
+            return
+
+        # Latest wins: replace an update the worker has not picked up yet
+        with self._queue_lock:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(self._last_notified)
+
+    def _drain(self) -> None:
+        """Dispatch queued updates until ``close`` is called."""
+        while (item := self._queue.get()) is not _STOP:
+            self._dispatch(*item)
+
+    def _dispatch(self, current: int, total: int, status: str | None) -> None:
+        """Call every observer and the callback with one update."""
+        # Snapshot the bound update methods first: an observer may register or
+        # remove observers mid-loop, and the hot loop then avoids a method
+        # lookup per observer
+        for update in [observer.update for observer in self._observers]:
+            update(current, total, status)
 
         # Call the callback if set
         if self._progress_callback:
-            self._progress_callback(current, total, self._status)
+            self._progress_callback(current, total, status)
 
     def increment(self, amount: int = 1, status: str | None = None) -> None:
         """Increment the progress value.
@@ -50,7 +50,7 @@ class GitHubServiceProtocol(Protocol):
     """Interface for GitHub service implementations."""
 
     def get_repos(self, limit: int = 100) -> list[dict[str, Any]]:
-        """Fetch repository information using GitHub CLI."""
+        """Fetch repository information from the GitHub REST API."""
         ...
 
     def get_repo_languages(self, repo_name: str) -> dict[str, float]:
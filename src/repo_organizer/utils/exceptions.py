@@ -2,7 +2,16 @@
 
 
 class APIError(Exception):
-    """Custom exception for API-related errors that should be retried."""
+    """Custom exception for API-related errors that should be retried.
+
+    Attributes:
+        retry_after: Seconds the server asked us to wait before retrying, when
+            the response carried a ``Retry-After`` or rate-limit reset header.
+    """
+
+    def __init__(self, message: str = "", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class RateLimitExceededError(APIError):
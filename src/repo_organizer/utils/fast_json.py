@@ -0,0 +1,33 @@
+"""Fast JSON decoding for API payloads.
+
+``orjson`` parses straight from ``bytes`` and is several times faster than the
+standard library on the list/object payloads returned by the GitHub REST API.
+It is imported optionally so that environments without the compiled wheel
+still work through the stdlib ``json`` module.
+
+``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers can
+keep catching the stdlib exception regardless of the backend in use.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – optional speed-up only
+    orjson = None  # type: ignore
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize *data* (raw response bytes or text) to a Python object.
+
+    Raises:
+        JSONDecodeError: If *data* is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,5 +1,6 @@
 """Rate limiter for API calls to respect service limits."""
 
+import asyncio
 import time
 from statistics import mean
 from threading import Lock
@@ -37,15 +38,11 @@ class RateLimiter:
         self.fail_on_limit = fail_on_limit
         self.rate_limit_exceptions = 0
 
-    def wait(self, logger=None, debug=False):
-        """Wait until next call is allowed according to rate limits.
-
-        Args:
-            logger: Optional logger to log rate limiting events
-            debug: Whether to enable debug logging for waits
+    def _reserve(self, logger=None, debug=False) -> float:
+        """Claim the next call slot and return how long to wait for it.
 
-        Returns:
-            Time waited in seconds
+        The slot is recorded before the caller sleeps, so concurrent callers
+        queue up one interval apart without holding the lock while waiting.
 
         Raises:
             RateLimitExceededError: If fail_on_limit is True and wait time exceeds max_wait_time
@@ -82,14 +79,58 @@ class RateLimiter:
                         f"Rate limit: Waiting {wait_time:.2f}s for {self.name} API",
                         level="debug",
                     )
-                time.sleep(wait_time)
                 self.wait_times.append(wait_time)
                 self.total_waits += 1
 
-            self.last_call_time = time.time()
+            self.last_call_time = current_time + wait_time
             self.total_calls += 1
             return wait_time
 
+    def wait(self, logger=None, debug=False):
+        """Wait until next call is allowed according to rate limits.
+
+        Args:
+            logger: Optional logger to log rate limiting events
+            debug: Whether to enable debug logging for waits
+
+        Returns:
+            Time waited in seconds
+
+        Raises:
+            RateLimitExceededError: If fail_on_limit is True and wait time exceeds max_wait_time
+        """
+        wait_time = self._reserve(logger, debug)
+        if wait_time:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def async_wait(self, logger=None, debug=False):
+        """Asynchronous variant of ``wait`` that yields to the event loop.
+
+        Args:
+            logger: Optional logger to log rate limiting events
+            debug: Whether to enable debug logging for waits
+
+        Returns:
+            Time waited in seconds
+
+        Raises:
+            RateLimitExceededError: If fail_on_limit is True and wait time exceeds max_wait_time
+        """
+        wait_time = self._reserve(logger, debug)
+        if wait_time:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every call for at least *seconds* from now.
+
+        Used when the service itself reports throttling (e.g. a ``retry-after``
+        header), which the fixed call spacing alone cannot anticipate.
+        """
+        with self.lock:
+            self.last_call_time = max(self.last_call_time, time.time() + seconds - self.interval)
+
     def get_stats(self) -> dict:
         """Get statistics about rate limiting.
 
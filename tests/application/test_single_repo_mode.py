@@ -138,3 +138,26 @@ def test_analyze_repositories_single_repo_not_found(mock_source_control, mock_an
         "Repository 'non-existent-repo' not found in 3 repositories",
         level="error",
     )
+
+
+def test_analyze_repositories_uses_batch_analyzer(mock_source_control):
+    """Test a batched run hands every repository to analyze_many in one call."""
+    analyzer = MagicMock()
+    analyzer.analyze_many.side_effect = lambda repo_datas: [d["repo_name"] for d in repo_datas]
+
+    results = analyze_repositories("testuser", mock_source_control, analyzer, batched=True)
+
+    assert results == ["repo1", "repo2", "repo3"]
+    analyzer.analyze_many.assert_called_once()
+    analyzer.analyze.assert_not_called()
+
+
+def test_analyze_repositories_analyzes_in_turn_unless_batched(mock_source_control):
+    """Test an analyzer is called per repository when batching is not requested."""
+    analyzer = MagicMock()
+    analyzer.analyze.side_effect = lambda repo_data: repo_data["repo_name"]
+
+    results = analyze_repositories("testuser", mock_source_control, analyzer)
+
+    assert results == ["repo1", "repo2", "repo3"]
+    analyzer.analyze_many.assert_not_called()
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from repo_organizer.cli.commands.actions_executor import execute_actions
+from repo_organizer.cli.commands.actions_executor import _load_analyses, execute_actions
 
 
 @pytest.fixture
@@ -77,3 +77,23 @@ class TestCommands:
 
         # Verify that AnalysisService.categorize_by_action was called
         mock_analysis_service.categorize_by_action.assert_called_once()
+
+
+class TestLoadAnalyses:
+    """Tests for loading analyses from markdown reports."""
+
+    def test_load_analyses_extracts_action(self, tmp_path):
+        """Test _load_analyses reads the action from the Action Items section."""
+        (tmp_path / "old-repo.md").write_text(
+            "# old-repo\n\n## Action Items\n\n- Archive this repository\n\n## Tags\n\n- delete\n",
+        )
+        (tmp_path / "good-repo.md").write_text("# good-repo\n\n## Summary\n\nUseful\n")
+        (tmp_path / "repositories_report.md").write_text("# Report\n")
+        settings = Mock()
+        settings.output_dir = str(tmp_path)
+
+        analyses = {a.repo_name: a for a in _load_analyses(settings)}
+
+        assert set(analyses) == {"old-repo", "good-repo"}
+        assert analyses["old-repo"].recommended_action == "ARCHIVE"
+        assert analyses["good-repo"].recommended_action == "KEEP"
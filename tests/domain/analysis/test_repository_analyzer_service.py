@@ -0,0 +1,136 @@
+"""Unit tests for the RepositoryAnalyzerService."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from repo_organizer.domain.analysis.action_recommendation_service import (
+    ActionRecommendationService,
+)
+from repo_organizer.domain.analysis.repository_analyzer_service import (
+    RepositoryAnalyzerService,
+)
+from repo_organizer.domain.core.events import event_bus
+from repo_organizer.domain.source_control.models import Repository
+
+
+def _repo(name):
+    return Repository(
+        name=name,
+        description=None,
+        url=None,
+        updated_at=None,
+        is_archived=False,
+        stars=0,
+        forks=0,
+    )
+
+
+class TestRepositoryAnalyzerService:
+    """Test suite for the RepositoryAnalyzerService."""
+
+    def test_existing_reports_are_listed_once(self, tmp_path, monkeypatch):
+        """Test report lookups scan the output directory a single time."""
+        (tmp_path / "done.json").write_text("{}")
+        service = RepositoryAnalyzerService(
+            output_dir=tmp_path,
+            source_control_port=MagicMock(),
+            analyzer_port=MagicMock(),
+        )
+        scandir = MagicMock(wraps=os.scandir)
+        monkeypatch.setattr(
+            "repo_organizer.domain.analysis.repository_analyzer_service.os.scandir",
+            scandir,
+        )
+
+        assert not service.should_analyze_repo(_repo("done"))
+        assert service.should_analyze_repo(_repo("new"))
+        assert scandir.call_count == 1
+
+        analysis = MagicMock()
+        analysis.to_pydantic.return_value.model_dump.return_value = {}
+        asyncio.run(service.write_report("new", analysis))
+
+        assert not service.should_analyze_repo(_repo("new"))
+        assert scandir.call_count == 1
+
+    def test_generate_reports_overlaps_analyses_up_to_the_limit(self, tmp_path, monkeypatch):
+        """Test blocking analyses run side by side, bounded by max_concurrency."""
+        monkeypatch.setattr(event_bus, "dispatch", AsyncMock())
+        monkeypatch.setattr(ActionRecommendationService, "recommend_action", AsyncMock())
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def analyze(data):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return MagicMock(name=data["name"])
+
+        analyzer = MagicMock()
+        analyzer.analyze.side_effect = analyze
+        source = MagicMock()
+        source.fetch_languages.return_value = []
+        source.recent_commits.return_value = []
+        source.contributors.return_value = []
+        service = RepositoryAnalyzerService(
+            output_dir=tmp_path,
+            source_control_port=source,
+            analyzer_port=analyzer,
+            max_concurrency=2,
+        )
+        monkeypatch.setattr(service, "write_report", AsyncMock())
+
+        analyses = asyncio.run(service.generate_reports([_repo(f"r{i}") for i in range(5)]))
+
+        assert len(analyses) == 5
+        assert peak[0] == 2
+
+    def test_known_languages_are_not_fetched_again(self, tmp_path, monkeypatch):
+        """Test a repository carrying its languages skips the language lookup."""
+        monkeypatch.setattr(event_bus, "dispatch", AsyncMock())
+        monkeypatch.setattr(ActionRecommendationService, "recommend_action", AsyncMock())
+        source = MagicMock()
+        source.recent_commits.return_value = []
+        source.contributors.return_value = []
+        analyzer = MagicMock()
+        service = RepositoryAnalyzerService(
+            output_dir=tmp_path,
+            source_control_port=source,
+            analyzer_port=analyzer,
+        )
+        monkeypatch.setattr(service, "write_report", AsyncMock())
+
+        repo = _repo("known").with_languages({"Python": 100.0})
+        asyncio.run(service.analyze_repository(repo))
+
+        source.fetch_languages.assert_not_called()
+        assert analyzer.analyze.call_args.args[0]["languages"] == {"Python": 100.0}
+
+    def test_async_analyzer_is_awaited_directly(self, tmp_path, monkeypatch):
+        """Test an analyzer with analyze_async is awaited instead of threaded."""
+        monkeypatch.setattr(event_bus, "dispatch", AsyncMock())
+        monkeypatch.setattr(ActionRecommendationService, "recommend_action", AsyncMock())
+        source = MagicMock()
+        source.fetch_languages.return_value = []
+        source.recent_commits.return_value = []
+        source.contributors.return_value = []
+        analyzer = MagicMock()
+        analyzer.analyze_async = AsyncMock(side_effect=lambda data: data["name"])
+        service = RepositoryAnalyzerService(
+            output_dir=tmp_path,
+            source_control_port=source,
+            analyzer_port=analyzer,
+        )
+        monkeypatch.setattr(service, "write_report", AsyncMock())
+
+        analyses = asyncio.run(service.analyze_repositories([_repo("a"), _repo("b")]))
+
+        assert analyses == ["a", "b"]
+        analyzer.analyze.assert_not_called()
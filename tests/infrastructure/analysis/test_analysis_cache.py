@@ -0,0 +1,88 @@
+"""Tests for the persistent analysis cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from repo_organizer.infrastructure.analysis import analysis_cache
+from repo_organizer.infrastructure.analysis.analysis_cache import AnalysisCache, analysis_key
+from repo_organizer.infrastructure.analysis.llm_service import LLMService
+from repo_organizer.infrastructure.analysis.pydantic_models import RepoAnalysis
+
+
+def _analysis(name):
+    return RepoAnalysis(
+        repo_name=name,
+        summary="A tool",
+        strengths=["Focused"],
+        weaknesses=["Untested"],
+        recommendations=[],
+        activity_assessment="Low",
+        estimated_value="Medium",
+        tags=["tool"],
+    )
+
+
+class TestAnalysisCache:
+    """Test suite for AnalysisCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Open a cache in a temporary directory."""
+        cache = AnalysisCache(str(tmp_path / "analyses.sqlite3"), ttl=60)
+        yield cache
+        cache.close()
+
+    def test_key_ignores_dict_order(self):
+        """Test equal inputs hash the same regardless of key order."""
+        assert analysis_key({"a": 1, "b": "x"}) == analysis_key({"b": "x", "a": 1})
+        assert analysis_key({"a": 1}) != analysis_key({"a": 2})
+
+    def test_key_covers_context(self):
+        """Test the same input under different settings hashes differently."""
+        assert analysis_key({"a": 1}, {"model": "m1"}) != analysis_key({"a": 1}, {"model": "m2"})
+        assert analysis_key({"a": 1}, {}) == analysis_key({"a": 1})
+
+    def test_entries_expire_after_ttl(self, cache, monkeypatch):
+        """Test a stored analysis is served until its TTL runs out."""
+        cache.put("k", "{}")
+        assert cache.get("k") == "{}"
+
+        now = analysis_cache.time.time()
+        monkeypatch.setattr(analysis_cache.time, "time", lambda: now + 61)
+        assert cache.get("k") is None
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_reuses_cached_analysis(self, mock_anthropic, tmp_path):
+        """Test unchanged input skips the chain unless a refresh is forced."""
+        service = LLMService("dummy_api_key", cache_path=str(tmp_path / "a.sqlite3"))
+        chain = MagicMock()
+        chain.invoke.return_value = _analysis("llm-name")
+        service._analysis_chain = chain
+        repo_data = {"repo_name": "tool", "readme_excerpt": "# Tool"}
+
+        first = service.analyze_repository(repo_data)
+        second = service.analyze_repository(repo_data)
+        assert chain.invoke.call_count == 1
+        assert first == second
+        assert second.repo_name == "tool"
+
+        service.analyze_repository(repo_data, force_refresh=True)
+        assert chain.invoke.call_count == 2
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_cache_is_per_model(self, mock_anthropic, tmp_path):
+        """Test an analysis made with one model is not served for another."""
+        cache_path = str(tmp_path / "a.sqlite3")
+        repo_data = {"repo_name": "tool", "readme_excerpt": "# Tool"}
+        chains = []
+        for model_name in ("model-a", "model-b"):
+            service = LLMService("dummy_api_key", model_name=model_name, cache_path=cache_path)
+            chain = MagicMock()
+            chain.invoke.return_value = _analysis("tool")
+            service._analysis_chain = chain
+            service.analyze_repository(repo_data)
+            service.close()
+            chains.append(chain)
+
+        assert [chain.invoke.call_count for chain in chains] == [1, 1]
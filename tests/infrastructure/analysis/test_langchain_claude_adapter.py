@@ -3,9 +3,10 @@
 These tests mock the LLMService to avoid actual API calls.
 """
 
+import asyncio
 import json
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -206,3 +207,125 @@ class TestLangChainClaudeAdapter:
         metrics = adapter.get_metrics()
         assert metrics["successful_requests"] == 1
         assert metrics["failed_requests"] == 0  # Successful after retries
+
+    def test_analyze_async_awaits_service_and_caches(
+        self,
+        adapter,
+        sample_repo_data,
+        mock_llm_service,
+    ):
+        """Test the async path awaits the LLM service and fills the cache."""
+        mock_llm_service.analyze_repository_async = AsyncMock(
+            return_value=mock_llm_service.analyze_repository.return_value,
+        )
+
+        first = asyncio.run(adapter.analyze_async(sample_repo_data))
+        second = asyncio.run(adapter.analyze_async(sample_repo_data))
+
+        assert isinstance(first, RepoAnalysis)
+        assert first.repo_name == "test-repo"
+        assert second is first
+        assert mock_llm_service.analyze_repository_async.await_count == 1
+        mock_llm_service.analyze_repository.assert_not_called()
+
+    def test_analyze_async_does_not_cache_failed_analysis(
+        self,
+        adapter,
+        sample_repo_data,
+        mock_llm_service,
+    ):
+        """Test the service's error placeholder is counted as failed, not cached."""
+        failed = mock_llm_service.analyze_repository.return_value.model_copy(
+            update={"tags": ["error", "analysis-failed"]},
+        )
+        mock_llm_service.analyze_repository_async = AsyncMock(return_value=failed)
+
+        first = asyncio.run(adapter.analyze_async(sample_repo_data))
+        asyncio.run(adapter.analyze_async(sample_repo_data))
+
+        assert "analysis-failed" in first.tags
+        assert mock_llm_service.analyze_repository_async.await_count == 2
+        metrics = adapter.get_metrics()
+        assert metrics["failed_requests"] == 2
+        assert metrics["successful_requests"] == 0
+
+    def test_analyze_many_sends_only_uncached_repos(
+        self,
+        adapter,
+        sample_repo_data,
+        mock_llm_service,
+    ):
+        """Test a batch skips cached repos and keeps results in input order."""
+        pyd_model = mock_llm_service.analyze_repository.return_value
+        mock_llm_service.analyze_repository_async = AsyncMock(return_value=pyd_model)
+        mock_llm_service.analyze_many_async = AsyncMock(return_value=[pyd_model])
+        cached = asyncio.run(adapter.analyze_async(sample_repo_data))
+        other = {**sample_repo_data, "repo_name": "other-repo"}
+
+        results = adapter.analyze_many([sample_repo_data, other])
+
+        assert results[0] is cached
+        assert isinstance(results[1], RepoAnalysis)
+        sent = mock_llm_service.analyze_many_async.await_args.args[0]
+        assert [repo["repo_name"] for repo in sent] == ["other-repo"]
+
+    def test_analyze_many_uses_message_batches_when_enabled(
+        self,
+        adapter,
+        sample_repo_data,
+        mock_llm_service,
+    ):
+        """Test the batch switch routes analyze_many through the Batches API."""
+        pyd_model = mock_llm_service.analyze_repository.return_value
+        mock_llm_service.analyze_repositories_batched.return_value = [pyd_model]
+        adapter.use_message_batches = True
+        adapter.batch_timeout = 60.0
+
+        results = adapter.analyze_many([sample_repo_data])
+
+        assert results[0].repo_name == "test-repo"
+        assert mock_llm_service.analyze_repositories_batched.call_args.kwargs["timeout"] == 60.0
+        mock_llm_service.analyze_many_async.assert_not_called()
+
+    def test_close_closes_llm_service(self, adapter, mock_llm_service):
+        """Test close releases the LLM service's connections and cache."""
+        adapter.close()
+
+        mock_llm_service.close.assert_called_once_with()
+
+    def test_speculation_threshold_reaches_llm_service(self, mock_logger):
+        """Test the speculation threshold enables the service's strict model."""
+        adapter = LangChainClaudeAdapter(
+            api_key="fake-api-key",
+            logger=mock_logger,
+            speculate_above_tokens=3000,
+        )
+
+        assert adapter._llm_service.speculate_above_tokens == 3000
+        assert adapter._llm_service.strict_llm is not None
+
+    def test_analyze_async_streams_progress_when_debugging(
+        self,
+        adapter,
+        sample_repo_data,
+        mock_llm_service,
+        mock_logger,
+    ):
+        """Test debug logging switches the async path to the streaming call."""
+        pyd_model = mock_llm_service.analyze_repository.return_value
+
+        async def stream(repo_data, on_text, force_refresh):
+            on_text("partial")
+            return pyd_model
+
+        mock_llm_service.analyze_repository_stream = stream
+        mock_logger.debug_enabled = True
+
+        result = asyncio.run(adapter.analyze_async(sample_repo_data))
+
+        assert result.repo_name == "test-repo"
+        mock_llm_service.analyze_repository_async.assert_not_called()
+        mock_logger.log.assert_any_call(
+            f"[{sample_repo_data['repo_name']}] Thinking progress: partial",
+            level="debug",
+        )
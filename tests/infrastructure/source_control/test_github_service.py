@@ -0,0 +1,520 @@
+"""Tests for the GitHub service local-repository helpers."""
+
+import json
+import sqlite3
+import subprocess
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from repo_organizer.infrastructure.source_control import github_service, readme_cache
+from repo_organizer.infrastructure.source_control.github_service import GitHubService
+from repo_organizer.infrastructure.source_control.readme_cache import ReadmeCache
+from repo_organizer.utils.exceptions import APIError
+
+
+def _git(repo_path, *args, env=None):
+    subprocess.run(
+        ["git", "-C", str(repo_path), *args],
+        check=True,
+        capture_output=True,
+        env=env,
+    )
+
+
+class TestGitHubServiceLocalRepo:
+    """Test suite for GitHubService methods that read a local clone."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a GitHub service without network dependencies."""
+        return GitHubService(github_username="test-user")
+
+    @pytest.fixture
+    def repo_path(self, tmp_path, monkeypatch):
+        """Create a small git repository with three commits."""
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "config", "user.email", "test@example.com")
+        for index, author in enumerate(["Alice", "Bob", "Alice"]):
+            (tmp_path / f"file{index}.txt").write_text(str(index))
+            _git(tmp_path, "add", ".")
+            _git(
+                tmp_path,
+                "-c",
+                f"user.name={author}",
+                "commit",
+                "-q",
+                "-m",
+                f"Commit {index}\n\nBody text",
+            )
+        return tmp_path
+
+    def test_get_repo_commits(self, service, repo_path):
+        """Test get_repo_commits returns the latest commits, newest first."""
+        commits = service.get_repo_commits(str(repo_path), limit=2)
+
+        assert [c.message for c in commits] == ["Commit 2", "Commit 1"]
+        assert [c.author for c in commits] == ["Alice", "Bob"]
+        assert all(len(c.hash) == 7 for c in commits)
+        assert commits[0].date == time.strftime("%Y-%m-%d")
+
+    def test_get_repo_commits_missing_path(self, service, tmp_path):
+        """Test get_repo_commits returns an empty list for a missing path."""
+        assert service.get_repo_commits(str(tmp_path / "missing")) == []
+
+    def test_get_repo_commits_batch(self, service, repo_path):
+        """Test get_repo_commits_batch returns parallel columns per commit."""
+        batch = service.get_repo_commits_batch(str(repo_path), limit=3)
+
+        assert len(batch) == 3
+        assert batch.messages == ["Commit 2", "Commit 1", "Commit 0"]
+        assert batch.authors == ["Alice", "Bob", "Alice"]
+        assert all(isinstance(ts, int) for ts in batch.dates)
+        assert [c.hash for c in batch.iter_commits()] == batch.hashes
+
+    def test_get_repo_contributors(self, service, repo_path):
+        """Test contributors are counted per author, most active first."""
+        contributors = service.get_repo_contributors(str(repo_path))
+
+        assert [(c.name, c.commits) for c in contributors] == [("Alice", 2), ("Bob", 1)]
+
+
+def _response(status_code=200, content=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode()
+    response.headers = headers or {}
+    response.iter_content.side_effect = lambda chunk_size=1: iter([content])
+    return response
+
+
+class TestGitHubServiceRest:
+    """Test suite for GitHubService methods backed by the REST API."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a GitHub service with a mocked HTTP session."""
+        service = GitHubService(github_username="test-user")
+        service._session = MagicMock()
+        return service
+
+    def test_get_repos(self, service):
+        """Test get_repos maps REST fields to the application keys."""
+        service._session.get.return_value = _response(
+            content=b'[{"name": "repo1", "description": "First", "html_url": "https://x/repo1",'
+            b' "updated_at": "2025-01-01T00:00:00Z", "archived": false,'
+            b' "stargazers_count": 3, "forks_count": 1}]',
+        )
+
+        repos = service.get_repos(limit=10)
+
+        assert repos == [
+            {
+                "name": "repo1",
+                "description": "First",
+                "url": "https://x/repo1",
+                "updatedAt": "2025-01-01T00:00:00Z",
+                "isArchived": False,
+                "stargazerCount": 3,
+                "forkCount": 1,
+            },
+        ]
+
+    def test_get_repos_drops_forks(self, service):
+        """Test forks, which ``type=owner`` still lists, are filtered out."""
+        service._session.get.return_value = _response(
+            content=b'[{"name": "mine"}, {"name": "copy", "fork": true}, {"name": "other"}]',
+        )
+
+        assert [r["name"] for r in service.get_repos(limit=10)] == ["mine", "other"]
+
+    def test_get_repos_fetches_remaining_pages_from_link_header(self, service):
+        """Test pages after the first are fetched per the Link rel="last" page."""
+        link = (
+            '<https://api.github.com/user/1/repos?per_page=100&page=2>; rel="next", '
+            '<https://api.github.com/user/1/repos?per_page=100&page=3>; rel="last"'
+        )
+
+        def fake_get(url, params=None, **kwargs):
+            assert params["per_page"] == 100
+            page = params["page"]
+            count = 100 if page < 3 else 20
+            body = ",".join([f'{{"name": "p{page}"}}'] * count).encode()
+            return _response(content=b"[" + body + b"]", headers={"Link": link})
+
+        service._session.get.side_effect = fake_get
+
+        repos = service.get_repos(limit=250)
+
+        assert len(repos) == 220
+        assert [repos[i]["name"] for i in (0, 100, 200)] == ["p1", "p2", "p3"]
+        assert service._session.get.call_count == 3
+
+    def test_get_repos_makes_up_for_forks_with_further_pages(self, service):
+        """Test forks dropped from the parallel pages are replaced from later ones."""
+        link = '<https://api.github.com/user/1/repos?per_page=100&page=2>; rel="last"'
+
+        def fake_get(url, params=None, **kwargs):
+            page = params["page"]
+            # The first 50 repositories listed are forks
+            repos = [
+                f'{{"name": "p{page}-{i}", "fork": {"true" if page == 1 and i < 50 else "false"}}}'
+                for i in range(100)
+            ]
+            return _response(
+                content=("[" + ",".join(repos) + "]").encode(),
+                headers={"Link": link},
+            )
+
+        service._session.get.side_effect = fake_get
+
+        repos = service.get_repos(limit=100)
+
+        assert len(repos) == 100
+        assert repos[0]["name"] == "p1-50"
+        assert repos[-1]["name"] == "p2-49"
+        assert service._session.get.call_count == 2
+
+    def test_get_repos_with_zero_limit_fetches_nothing(self, service):
+        """Test a zero limit returns no repositories without any request."""
+        assert service.get_repos(limit=0) == []
+        service._session.get.assert_not_called()
+
+    def test_invalid_json_raises_api_error(self, service):
+        """Test a malformed JSON body is reported as a retryable APIError."""
+        service._session.get.return_value = _response(content=b"<html>")
+
+        with pytest.raises(APIError, match="Invalid JSON when fetching repos"):
+            service._fetch_repos_page(1, 10)
+
+    def test_get_repo_languages(self, service):
+        """Test get_repo_languages converts byte counts to percentages."""
+        service._session.get.return_value = _response(
+            content=b'{"Python": 300, "Shell": 100}',
+        )
+
+        assert service.get_repo_languages("repo1") == {"Python": 75.0, "Shell": 25.0}
+
+    def test_get_repo_languages_memoised(self, service):
+        """Test repeat lookups are answered from the in-process memo."""
+        service._session.get.return_value = _response(content=b'{"Go": 1}')
+
+        service.get_repo_languages("repo1")
+        service.get_repo_languages("repo1")["Go"] = 0.0
+
+        assert service.get_repo_languages("repo1") == {"Go": 100.0}
+        assert service._session.get.call_count == 1
+
+    def test_get_repo_languages_empty_body(self, service, monkeypatch):
+        """Test an empty language map is returned without parsing JSON."""
+        monkeypatch.setattr(
+            github_service.fast_json, "loads", MagicMock(side_effect=AssertionError)
+        )
+        service._session.get.return_value = _response(content=b"{}\n")
+
+        assert service.get_repo_languages("repo1") == {}
+
+    def test_get_repo_languages_missing_repo(self, service):
+        """Test get_repo_languages treats a 404 as no languages."""
+        service._session.get.return_value = _response(status_code=404)
+
+        assert service.get_repo_languages("repo1") == {}
+
+    def test_get_repo_readme_streams_and_truncates(self, service):
+        """Test the README body is streamed and cut at max_bytes."""
+        service._session.get.return_value = _response(content=b"# Title\n" + b"x" * 100)
+
+        assert service.get_repo_readme("repo1", max_bytes=10) == "# Title\nxx"
+        assert service._session.get.call_args.kwargs["stream"] is True
+        service._session.get.return_value.close.assert_called_once()
+
+    def test_streamed_error_response_is_closed(self, service):
+        """Test a streamed README answered with 404 releases its connection."""
+        service._session.get.return_value = _response(status_code=404)
+
+        assert service.get_repo_readme("gone") == ""
+        service._session.get.return_value.close.assert_called_once()
+
+    def test_get_repo_languages_retries_on_server_error(self, service, monkeypatch):
+        """Test transient API errors are retried before succeeding."""
+        sleeps = []
+        monkeypatch.setattr(github_service.time, "sleep", sleeps.append)
+        service._session.get.side_effect = [
+            _response(status_code=502),
+            _response(content=b'{"Go": 10}'),
+        ]
+
+        assert service.get_repo_languages("repo1") == {"Go": 100.0}
+        assert len(sleeps) == 1
+
+    def test_retry_honours_retry_after_header(self, service, monkeypatch):
+        """Test a Retry-After header overrides the jittered back-off."""
+        sleeps = []
+        monkeypatch.setattr(github_service.time, "sleep", sleeps.append)
+        service._session.get.side_effect = [
+            _response(status_code=403, headers={"Retry-After": "7"}),
+            _response(content=b'{"Go": 10}'),
+        ]
+
+        assert service.get_repo_languages("repo1") == {"Go": 100.0}
+        assert sleeps == [7.0]
+
+    def test_get_repo_languages_gives_up_after_three_attempts(self, service, monkeypatch):
+        """Test the final APIError propagates once retries are exhausted."""
+        monkeypatch.setattr(github_service.time, "sleep", lambda _: None)
+        service._session.get.return_value = _response(status_code=500)
+
+        with pytest.raises(APIError):
+            service.get_repo_languages("repo1")
+        assert service._session.get.call_count == 3
+
+    def test_conditional_request_cache_reuses_body_on_304(self, tmp_path):
+        """Test a stored ETag is revalidated and the cached body reused."""
+        service = GitHubService(github_username="test-user", cache_path=str(tmp_path / "http"))
+        service._session = MagicMock()
+        service._session.get.side_effect = [
+            _response(content=b'{"C": 1}', headers={"ETag": '"abc"'}),
+            _response(status_code=304),
+        ]
+
+        assert service.get_repo_languages("repo1") == {"C": 100.0}
+        service.clear_cache()
+        assert service.get_repo_languages("repo1") == {"C": 100.0}
+        second_call = service._session.get.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_conditional_request_cache_keeps_link_header(self, tmp_path):
+        """Test a revalidated response still exposes the stored Link header."""
+        service = GitHubService(github_username="test-user", cache_path=str(tmp_path / "http"))
+        service._session = MagicMock()
+        link = '<https://api.github.com/x?page=7>; rel="last"'
+        service._session.get.side_effect = [
+            _response(content=b"[{}]", headers={"ETag": '"e"', "Link": link}),
+            _response(status_code=304),
+        ]
+        url = "https://api.github.com/x"
+
+        service._cached_get(url, timeout=1)
+        response = service._cached_get(url, timeout=1)
+
+        assert response.status_code == 200
+        assert response.headers["Link"] == link
+
+    def test_conditional_request_cache_remembers_404(self, tmp_path):
+        """Test a missing file is not probed again within the cache TTL."""
+        service = GitHubService(github_username="test-user", cache_path=str(tmp_path / "http"))
+        service._session = MagicMock()
+        service._session.get.return_value = _response(status_code=404)
+
+        first = service.get_repo_dependency_files("repo1")
+        second = service.get_repo_dependency_files("repo1")
+
+        assert first == second == {}
+        assert service._session.get.call_count == len(github_service._DEPENDENCY_FILES)
+
+    def test_get_repo_readme_served_from_disk_cache(self, tmp_path):
+        """Test a README cached on disk is served without a second request."""
+        cache_path = str(tmp_path / "readmes.sqlite3")
+        service = GitHubService(github_username="test-user", readme_cache_path=cache_path)
+        service._session = MagicMock()
+        service._session.get.return_value = _response(content=b"# Cached")
+
+        assert service.get_repo_readme("repo1") == "# Cached"
+        assert service._session.get.call_count == 1
+
+        fresh = GitHubService(github_username="test-user", readme_cache_path=cache_path)
+        fresh._session = MagicMock()
+        assert fresh.get_repo_readme("repo1") == "# Cached"
+        fresh._session.get.assert_not_called()
+
+    def test_get_repo_readme_bypasses_http_cache(self, tmp_path):
+        """Test READMEs are persisted only by the README cache, not the HTTP cache."""
+        for _ in range(2):
+            service = GitHubService(github_username="test-user", cache_path=str(tmp_path / "http"))
+            service._session = MagicMock()
+            service._session.get.return_value = _response(content=b"# Hi", headers={"ETag": '"a"'})
+
+            assert service.get_repo_readme("repo1") == "# Hi"
+            assert "If-None-Match" not in service._session.get.call_args.kwargs["headers"]
+            service.close()
+
+    def test_readme_cache_evicts_expired_and_surplus_entries(self, tmp_path, monkeypatch):
+        """Test reopening the README cache drops stale and overflow entries."""
+        path = str(tmp_path / "readmes.sqlite3")
+        cache = ReadmeCache(path, ttl=60)
+        now = readme_cache.time.time()
+        monkeypatch.setattr(readme_cache.time, "time", lambda: now - 120)
+        cache.put("stale", 5000, "# Old")
+        for age, name in enumerate(("c", "b", "a")):
+            monkeypatch.setattr(readme_cache.time, "time", lambda age=age: now - age)
+            cache.put(name, 5000, f"# {name}")
+        monkeypatch.setattr(readme_cache.time, "time", lambda: now)
+        cache.close()
+
+        cache = ReadmeCache(path, ttl=3600, max_entries=2)
+        blobs = cache._conn.execute("SELECT COUNT(*) FROM readme_blobs").fetchone()[0]
+
+        assert [cache.get(name, 5000) for name in ("stale", "a", "b", "c")] == [
+            None,
+            None,
+            "# b",
+            "# c",
+        ]
+        assert blobs == 2
+        cache.close()
+
+    def test_close_releases_session_and_disk_caches(self, tmp_path):
+        """Test close shuts the HTTP session and both on-disk caches."""
+        service = GitHubService(
+            github_username="test-user",
+            cache_path=str(tmp_path / "http"),
+            readme_cache_path=str(tmp_path / "readmes.sqlite3"),
+        )
+        service._session = MagicMock()
+        readme_cache = service._readme_cache
+
+        service.close()
+        service.close()
+
+        assert service._session.close.call_count == 2
+        assert service._http_cache is None
+        assert service._readme_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            readme_cache.get("repo1", 5000)
+
+    def test_get_repo_dependency_files_graphql(self):
+        """Test dependency manifests are read with a single GraphQL request."""
+        service = GitHubService(github_username="test-user", github_token="token")
+        service._session = MagicMock()
+        service._session.post.return_value = _response(
+            content=b'{"data": {"repository": {"f0": null,'
+            b' "f1": {"text": "requests\\n# comment\\nrich\\n"}, "f8": {"text": "module x"}}}}',
+        )
+
+        result = service.get_repo_dependency_files("repo1")
+
+        assert result["requirements.txt"] == "requests\n# comment\nrich\n"
+        assert result["go.mod"] == "module x"
+        assert result["summary"] == "Python project with 2 dependencies, Go module"
+        assert service._session.post.call_count == 1
+        service._session.get.assert_not_called()
+
+    def test_get_repo_dependency_files_rest_requests_raw_content(self, service):
+        """Test the REST probe asks for raw file bytes instead of base64 JSON."""
+
+        def fake_get(url, headers=None, **kwargs):
+            assert headers == {"Accept": "application/vnd.github.raw"}
+            if url.endswith("/Cargo.toml"):
+                return _response(content=b'[package]\nname = "x"\n')
+            return _response(status_code=404)
+
+        service._session.get.side_effect = fake_get
+
+        result = service.get_repo_dependency_files("repo1")
+
+        assert result["Cargo.toml"] == '[package]\nname = "x"\n'
+        assert result["summary"] == "Rust project"
+
+    def test_get_repo_issues_stats_graphql(self):
+        """Test the three issue counts come from a single GraphQL query."""
+        service = GitHubService(github_username="test-user", github_token="token")
+        service._session = MagicMock()
+        service._session.post.return_value = _response(
+            content=b'{"data": {"repository": {"open": {"totalCount": 4},'
+            b' "closed": {"totalCount": 9}, "recent": {"totalCount": 0}}}}',
+        )
+
+        assert service.get_repo_issues_stats("repo1") == {
+            "open_count": 4,
+            "closed_count": 9,
+            "recent_activity": False,
+        }
+        assert service._session.post.call_count == 1
+        service._session.get.assert_not_called()
+
+    def test_get_repo_issues_stats_rest_link_header_counts(self, service):
+        """Test without a token the counts come from the /issues Link header."""
+        last_pages = {"open": 4, "closed": 9}
+
+        def fake_get(url, params=None, **kwargs):
+            assert url.endswith("/repos/test-user/repo1/issues")
+            assert params["per_page"] == 1
+            if params["state"] == "all":
+                return _response(content=b"[]")
+            link = f'<{url}?page={last_pages[params["state"]]}>; rel="last"'
+            return _response(content=b"[{}]", headers={"Link": link})
+
+        service._session.get.side_effect = fake_get
+
+        assert service.get_repo_issues_stats("repo1") == {
+            "open_count": 4,
+            "closed_count": 9,
+            "recent_activity": False,
+        }
+        assert service._session.get.call_count == 3
+
+    def test_get_repo_issues_stats_missing_repo(self, service):
+        """Test a rejected request (404) is reported as no issues."""
+        service._session.get.return_value = _response(status_code=404)
+
+        assert service.get_repo_issues_stats("gone") == {
+            "open_count": 0,
+            "closed_count": 0,
+            "recent_activity": False,
+        }
+
+    def test_get_repo_commit_activity_counts_trailing_four_weeks(self, service):
+        """Test recent commits are the trailing weeks, which GitHub lists last."""
+        week = 7 * 24 * 3600
+        now = int(time.time())
+        weeks = [{"week": now - (10 - i) * week, "total": 1} for i in range(6)]
+        weeks += [{"week": now - (3 - i) * week, "total": 2} for i in range(4)]
+        service._session.get.return_value = _response(content=json.dumps(weeks).encode())
+
+        assert service.get_repo_commit_activity("repo1") == {
+            "recent_commits": 8,
+            "active_weeks": 10,
+            "total_commits": 14,
+        }
+
+    def test_get_repo_commit_activity_at_week_boundary(self, service, monkeypatch):
+        """Test a week that has just begun does not pull in a fifth bucket."""
+        week = 7 * 24 * 3600
+        current_week = 1_700_000_000
+        monkeypatch.setattr(github_service.time, "time", lambda: float(current_week))
+        weeks = [{"week": current_week - (5 - i) * week, "total": 10**i} for i in range(6)]
+        service._session.get.return_value = _response(content=json.dumps(weeks).encode())
+
+        assert service.get_repo_commit_activity("repo1")["recent_commits"] == 111100
+
+    def test_get_repo_issues_stats_uses_listed_repo(self, service):
+        """Test the get_repos payload spares requests for known repositories."""
+        service._session.get.return_value = _response(
+            content=b'[{"name": "quiet", "has_issues": true, "open_issues_count": 0},'
+            b' {"name": "off", "has_issues": false, "open_issues_count": 0}]',
+        )
+        service.get_repos(limit=10)
+        service._session.get.reset_mock()
+        service._session.get.return_value = _response(content=b"[{}, {}]")
+
+        assert service.get_repo_issues_stats("off")["open_count"] == 0
+        service._session.get.assert_not_called()
+
+        assert service.get_repo_issues_stats("quiet") == {
+            "open_count": 0,
+            "closed_count": 2,
+            "recent_activity": True,
+        }
+        assert service._session.get.call_count == 2
+
+    def test_unexpected_payload_error_is_not_retried(self, service):
+        """Test a programming error surfaces at once instead of being retried."""
+        service._session.get.return_value = _response(content=b"[1, 2]")
+
+        with pytest.raises(AttributeError):
+            service.get_repo_commit_activity("repo1")
+        assert service._session.get.call_count == 1
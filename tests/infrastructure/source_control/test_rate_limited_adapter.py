@@ -0,0 +1,66 @@
+"""Tests for the rate-limiting transport adapter."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from repo_organizer.infrastructure.source_control import rate_limited_adapter
+from repo_organizer.infrastructure.source_control.rate_limited_adapter import (
+    RateLimitedAdapter,
+)
+
+
+def _request(url):
+    return requests.Request("GET", url).prepare()
+
+
+def _response(headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRateLimitedAdapter:
+    """Test suite for RateLimitedAdapter."""
+
+    @pytest.fixture
+    def sent(self, monkeypatch):
+        """Replace the real transport with a queue of canned responses."""
+        responses = []
+        monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kw: responses.pop(0))
+        return responses
+
+    def test_send_waits_on_limiter(self, sent):
+        """Test every request waits on the limiter."""
+        limiter = MagicMock()
+        adapter = RateLimitedAdapter(limiter)
+        sent.extend([_response(), _response()])
+
+        adapter.send(_request("https://api.github.com/repos/u/r/languages"))
+        adapter.send(_request("https://api.github.com/repos/u/r/readme"))
+
+        assert limiter.wait.call_count == 2
+
+    def test_exhausted_quota_pauses_next_request(self, sent, monkeypatch):
+        """Test a response with no remaining quota holds back the next send."""
+        sleeps = []
+        monkeypatch.setattr(rate_limited_adapter.time, "sleep", sleeps.append)
+        adapter = RateLimitedAdapter()
+        reset = str(int(time.time()) + 60)
+        sent.extend(
+            [
+                _response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}),
+                _response(),
+            ]
+        )
+
+        adapter.send(_request("https://api.github.com/user/repos"))
+        assert sleeps == []
+        adapter.send(_request("https://api.github.com/user/repos"))
+
+        assert len(sleeps) == 1
+        assert 50 < sleeps[0] <= 60
@@ -0,0 +1,136 @@
+"""Tests for the progress reporter."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from repo_organizer.services import progress_reporter
+from repo_organizer.services.progress_reporter import ProgressReporter
+
+
+class TestProgressReporter:
+    """Test suite for ProgressReporter."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the monotonic clock with a settable value."""
+        now = [100.0]
+        monkeypatch.setattr(progress_reporter.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_updates_are_throttled_and_flushed(self, clock):
+        """Test rapid updates coalesce and the latest one is flushed."""
+        reporter = ProgressReporter(min_interval=1.0)
+        observer = MagicMock()
+        reporter.register_observer(observer)
+
+        reporter.update_progress(1, 10)
+        reporter.update_progress(2, 10)
+        reporter.update_progress(3, 10)
+        assert observer.update.call_count == 1
+
+        reporter.flush()
+        observer.update.assert_called_with(3, 10, None)
+        assert observer.update.call_count == 2
+
+        reporter.flush()
+        assert observer.update.call_count == 2
+
+    def test_completion_and_status_changes_always_notify(self, clock):
+        """Test the final update and new statuses bypass the throttle."""
+        reporter = ProgressReporter(min_interval=1.0)
+        callback = MagicMock()
+        reporter.set_progress_callback(callback)
+
+        reporter.update_progress(1, 3, "Fetching")
+        reporter.update_progress(2, 3, "Analyzing")
+        reporter.update_progress(3, 3, "Analyzing")
+
+        assert [c.args for c in callback.call_args_list] == [
+            (1, 3, "Fetching"),
+            (2, 3, "Analyzing"),
+            (3, 3, "Analyzing"),
+        ]
+
+    def test_identical_updates_are_dropped(self, clock):
+        """Test repeating the last delivered state notifies nobody."""
+        reporter = ProgressReporter(min_interval=0.0)
+        observer = MagicMock()
+        reporter.register_observer(observer)
+
+        reporter.update_progress(1, 10, "Analyzing")
+        reporter.update_progress(1, 10, "Analyzing")
+        reporter.increment(0, "Analyzing")
+
+        assert observer.update.call_count == 1
+        assert reporter.get_progress().current == 1
+
+    def test_observers_are_held_until_removed(self):
+        """Test an observer the caller does not keep is still notified."""
+        calls = []
+
+        class Observer:
+            def update(self, current, total, status=None):
+                calls.append(current)
+
+        reporter = ProgressReporter(min_interval=0.0)
+        reporter.register_observer(Observer())
+        reporter.update_progress(1, 10)
+
+        assert calls == [1]
+
+        reporter.remove_observer(reporter._observers[0])
+        reporter.update_progress(2, 10)
+
+        assert calls == [1]
+
+    def test_equal_statuses_share_one_string(self):
+        """Test repeated status messages are interned through the pool."""
+        reporter = ProgressReporter(min_interval=0.0)
+
+        reporter.update_progress(1, 10, "".join(["Analyz", "ing\nrepo"]))
+        first = reporter.get_progress().status
+        reporter.update_progress(2, 10, "".join(["Analyzi", "ng\nrepo"]))
+
+        assert first == "Analyzing repo"
+        assert reporter.get_progress().status is first
+
+    def test_line_breaks_become_spaces(self):
+        """Test newlines and carriage returns are flattened in statuses."""
+        reporter = ProgressReporter(min_interval=0.0)
+
+        reporter.update_progress(1, 10, "Fetching\r\nlanguages")
+
+        assert reporter.get_progress().status == "Fetching  languages"
+
+    def test_progress_snapshot_is_immutable(self):
+        """Test get_progress returns a frozen, hashable snapshot."""
+        reporter = ProgressReporter(min_interval=0.0)
+        reporter.update_progress(1, 10, "Analyzing")
+
+        snapshot = reporter.get_progress()
+
+        with pytest.raises(AttributeError):
+            snapshot.current = 2
+        assert hash(snapshot) == hash(reporter.get_progress())
+
+    def test_background_dispatch_does_not_block_and_keeps_latest(self):
+        """Test a slow observer runs off-thread and skips superseded updates."""
+        release = threading.Event()
+        calls = []
+
+        def slow_callback(current, total, status):
+            release.wait()
+            calls.append(current)
+
+        reporter = ProgressReporter(min_interval=0.0, background=True)
+        reporter.set_progress_callback(slow_callback)
+
+        for current in range(1, 6):
+            reporter.update_progress(current, 10)
+        release.set()
+        reporter.close()
+
+        assert calls[-1] == 5
+        assert len(calls) < 5
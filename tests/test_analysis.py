@@ -14,6 +14,22 @@ from repo_organizer.infrastructure.analysis.pydantic_models import (
 )
 
 
+def _analysis_json(summary):
+    """Return a minimal valid analysis as the model would reply with it."""
+    return json.dumps(
+        {
+            "repo_name": "ignored",
+            "summary": summary,
+            "strengths": [],
+            "weaknesses": [],
+            "recommendations": [],
+            "activity_assessment": "Low",
+            "estimated_value": "Low",
+            "tags": [],
+        },
+    )
+
+
 class TestRepositoryAnalysis(unittest.TestCase):
     """Tests for the repository analysis functionality."""
 
@@ -77,6 +93,259 @@ class TestRepositoryAnalysis(unittest.TestCase):
         self.assertIsInstance(result.recommendations[0], RepoRecommendation)
         self.assertEqual(result.estimated_value, "Medium")
 
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_analyze_many_keeps_order(self, mock_anthropic):
+        """Test concurrent analyses come back in input order."""
+        repos = [{**self.sample_repo_data, "repo_name": f"repo_{i}"} for i in range(5)]
+
+        llm_service = LLMService("dummy_api_key")
+        results = llm_service.analyze_many(repos, concurrency=2)
+
+        self.assertEqual([r.repo_name for r in results], [r["repo_name"] for r in repos])
+        self.assertTrue(all(isinstance(r, RepoAnalysis) for r in results))
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_analyze_many_inside_running_loop(self, mock_anthropic):
+        """Test the blocking wrapper also works when an event loop is running."""
+        import asyncio
+
+        llm_service = LLMService("dummy_api_key")
+
+        async def caller():
+            return llm_service.analyze_many([self.sample_repo_data])
+
+        results = asyncio.run(caller())
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], RepoAnalysis)
+
+    def test_llm_service_prompt_substitutes_fields(self):
+        """Test the rendered prompt carries repository data and literal JSON."""
+        from repo_organizer.infrastructure.analysis.llm_service import _render_prompt
+
+        data = {**self.sample_repo_data, "format_instructions": "SCHEMA"}
+        for field in ("is_archived", "open_issues", "closed_issues", "recent_commits_count"):
+            data.setdefault(field, 0)
+        for field in ("languages", "activity_summary", "contributor_summary", "dependency_info"):
+            data.setdefault(field, "n/a")
+
+        (message,) = _render_prompt(data)
+
+        self.assertIn("- Name: youtube_playlist_organizer", message.content)
+        self.assertIn("SCHEMA", message.content)
+        self.assertIn('{"recommendation": "Improve test coverage"', message.content)
+        self.assertNotIn("{repo_name}", message.content)
+
+    def test_llm_service_repairs_fenced_json(self):
+        """Test model output wrapped in prose and fences still parses."""
+        from repo_organizer.infrastructure.analysis.llm_service import _loads_lenient
+
+        content = 'Here you go:\n```json\n{"tags": ["a}", "b",], "stars": 3,}\n```\nDone {ok}'
+
+        self.assertEqual(_loads_lenient(content), {"tags": ["a}", "b"], "stars": 3})
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.OutputFixingParser.invoke")
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_repairs_without_fixing_call(self, mock_anthropic, mock_fix):
+        """Test repairable output is parsed without an OutputFixingParser call."""
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+        payload = _analysis_json("Organizes playlists")
+        mock_anthropic.return_value = FakeListChatModel(responses=[payload[:-1] + ",}"])
+
+        llm_service = LLMService("dummy_api_key")
+        result = llm_service.analyze_repository(self.sample_repo_data)
+
+        self.assertEqual(result.summary, "Organizes playlists")
+        self.assertEqual(result.repo_name, "youtube_playlist_organizer")
+        mock_fix.assert_not_called()
+        self.assertIsNone(llm_service._output_fixing_parser)
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_truncates_long_fields(self, mock_anthropic):
+        """Test oversized prompt fields are cut to their token budget."""
+        llm_service = LLMService("dummy_api_key", field_token_budgets={"readme_excerpt": 10})
+        data = {**self.sample_repo_data, "readme_excerpt": "x" * 1000}
+
+        prepared = llm_service._prepare_analysis_input(data)
+
+        self.assertTrue(prepared["readme_excerpt"].startswith("x" * 40))
+        self.assertLess(len(prepared["readme_excerpt"]), 100)
+        self.assertEqual(prepared["repo_desc"], self.sample_repo_data["repo_desc"])
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_stream_parses_first_object(self, mock_anthropic):
+        """Test streamed output is parsed once its JSON object closes."""
+        import asyncio
+
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+        payload = _analysis_json("Uses {braces} in text")
+        mock_anthropic.return_value = FakeListChatModel(responses=[payload + " trailing } prose"])
+        fragments = []
+
+        result = asyncio.run(
+            LLMService("dummy_api_key").analyze_repository_stream(
+                self.sample_repo_data,
+                on_text=fragments.append,
+            ),
+        )
+
+        self.assertEqual(result.summary, "Uses {braces} in text")
+        self.assertEqual("".join(fragments), payload)
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_stream_honours_force_refresh(self, mock_anthropic):
+        """Test a forced streaming analysis skips the cached result."""
+        import asyncio
+
+        llm_service = LLMService("dummy_api_key")
+        cached = MagicMock()
+        llm_service._cached_analysis = MagicMock(return_value=cached)
+        llm_service._sized_llm = MagicMock(side_effect=RuntimeError("no model"))
+        llm_service._fallback_analysis = MagicMock(return_value="fresh")
+
+        stream = llm_service.analyze_repository_stream
+        self.assertIs(asyncio.run(stream(self.sample_repo_data)), cached)
+        self.assertEqual(asyncio.run(stream(self.sample_repo_data, force_refresh=True)), "fresh")
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_strict_model_output_budget(self, mock_anthropic):
+        """Test the speculative strict model is not left at the 1024-token default."""
+        LLMService("dummy_api_key", thinking_enabled=False, speculate_above_tokens=10)
+        self.assertEqual(mock_anthropic.call_args.kwargs["max_tokens"], 4096)
+
+        LLMService("dummy_api_key", thinking_budget=8000, speculate_above_tokens=10)
+        self.assertEqual(mock_anthropic.call_args.kwargs["max_tokens"], 12000)
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_speculative_strict_call_wins(self, mock_anthropic):
+        """Test a large README races a strict call and cancels the slow chain."""
+        import asyncio
+
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+        payload = _analysis_json("Strict answer")
+        mock_anthropic.return_value = FakeListChatModel(responses=[payload])
+        cancelled = []
+
+        async def slow_chain(data):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        llm_service = LLMService("dummy_api_key", speculate_above_tokens=10)
+        llm_service._analysis_chain = MagicMock(ainvoke=slow_chain)
+
+        result = asyncio.run(llm_service.analyze_repository_async(self.sample_repo_data))
+
+        self.assertEqual(result.summary, "Strict answer")
+        self.assertEqual(cancelled, [True])
+
+    @patch("anthropic.Anthropic")
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_batched_analysis(self, mock_anthropic, mock_client_cls):
+        """Test batch results map back to repositories by custom id."""
+        payload = _analysis_json("Batched answer")
+        batches = mock_client_cls.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="b1", processing_status="ended")
+        succeeded = MagicMock(custom_id="repo-0")
+        succeeded.result.type = "succeeded"
+        succeeded.result.message.content = [MagicMock(type="text", text=payload)]
+        errored = MagicMock(custom_id="repo-1")
+        errored.result.type = "errored"
+        batches.results.return_value = [succeeded, errored]
+        repos = [{**self.sample_repo_data, "repo_name": f"repo_{i}"} for i in range(2)]
+
+        llm_service = LLMService("dummy_api_key")
+        results = llm_service.analyze_repositories_batched(repos)
+
+        self.assertEqual(len(batches.create.call_args.kwargs["requests"]), 2)
+        self.assertEqual(results[0].summary, "Batched answer")
+        self.assertEqual(results[0].repo_name, "repo_0")
+        self.assertIn("analysis-failed", results[1].tags)
+
+        # The pooled SDK client is reused until the service is closed
+        llm_service.analyze_repositories_batched(repos[:1])
+        mock_client_cls.assert_called_once()
+        llm_service.close()
+        mock_client_cls.return_value.close.assert_called_once()
+
+    @patch("anthropic.Anthropic")
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_batched_analysis_times_out(self, mock_anthropic, mock_client_cls):
+        """Test a batch still running at the deadline is cancelled."""
+        batches = mock_client_cls.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="b1", processing_status="in_progress")
+        batches.retrieve.return_value = batches.create.return_value
+
+        llm_service = LLMService("dummy_api_key")
+        results = llm_service.analyze_repositories_batched(
+            [self.sample_repo_data],
+            poll_interval=0,
+            timeout=0,
+        )
+
+        batches.cancel.assert_called_once_with("b1")
+        batches.results.assert_not_called()
+        self.assertIn("analysis-failed", results[0].tags)
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_sizes_thinking_budget(self, mock_anthropic):
+        """Test the thinking budget follows the size of the repository content."""
+        from repo_organizer.infrastructure.analysis.llm_service import (
+            _PROMPT_DEFAULTS,
+            _render_prompt,
+        )
+
+        llm_service = LLMService("dummy_api_key", thinking_budget=16000)
+
+        def override(readme_tokens):
+            data = {**self.sample_repo_data, "readme_excerpt": "x" * (readme_tokens * 4)}
+            prepared = llm_service._prepare_analysis_input(data)
+            return llm_service._thinking_override(_render_prompt({**_PROMPT_DEFAULTS, **prepared}))
+
+        self.assertEqual(override(10), {"type": "disabled"})
+        self.assertEqual(override(1000), {"type": "enabled", "budget_tokens": 4000})
+        self.assertIsNone(override(3000))
+
+    @patch("repo_organizer.infrastructure.analysis.llm_service.ChatAnthropic")
+    def test_llm_service_builds_chain_once_across_threads(self, mock_anthropic):
+        """Test concurrent first calls share a single chain build."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        llm_service = LLMService("dummy_api_key")
+
+        def slow_build():
+            time.sleep(0.05)
+            return object()
+
+        with (
+            patch.object(llm_service, "_build_analysis_chain", side_effect=slow_build) as build,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            chains = list(pool.map(lambda _: llm_service.create_analysis_chain(), range(8)))
+
+        build.assert_called_once()
+        self.assertEqual(len({id(chain) for chain in chains}), 1)
+
+    def test_retry_after_pauses_rate_limiter(self):
+        """Test a throttled API error holds back the next limiter slot."""
+        from repo_organizer.infrastructure.analysis.llm_service import _retry_after
+        from repo_organizer.utils.rate_limiter import RateLimiter
+
+        error = Exception("429")
+        error.response = MagicMock(headers={"retry-after": "30"})
+        limiter = RateLimiter(60)
+
+        limiter.pause(_retry_after(error))
+
+        self.assertAlmostEqual(limiter._reserve(), 30, delta=1)
+        self.assertIsNone(_retry_after(Exception("no response")))
+
     @patch("repo_organizer.domain.analysis.protocols.AnalyzerPort")
     @patch(
         "repo_organizer.domain.source_control.protocols.SourceControlPort",